@@ -13,11 +13,35 @@
 import os
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+def _scan_form_name(filename, file_path):
+    """Return (clean_filename, form_name, message) for one CSV; form_name is None on failure."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            if "Form Name" in header:
+                form_name_index = header.index("Form Name")
+                try:
+                    first_row = next(reader)
+                    form_name = first_row[form_name_index]
+                    # Clean up the filename to use as a key
+                    clean_filename = os.path.splitext(filename)[0].replace('v_ALLALS_AS_', '').replace('v_ALLALS_PV_', '').replace('v_ALLALS_PR_', '').replace('-', '_')
+                    return clean_filename, form_name, None
+                except StopIteration:
+                    return None, None, f"File is empty (after header): {filename}"
+            else:
+                return None, None, f"'Form Name' column not found in {filename}"
+    except Exception as e:
+        return None, None, f"Error processing file {filename}: {e}"
+
 
 def get_form_names_from_datasets(base_dir):
     datasets = ["ASSESS", "PREVENT"]
     form_name_mapping = {}
 
+    files = []
     for dataset in datasets:
         dataset_files_path = os.path.join(base_dir, dataset, 'files')
         if not os.path.isdir(dataset_files_path):
@@ -26,25 +50,18 @@ def get_form_names_from_datasets(base_dir):
 
         for filename in os.listdir(dataset_files_path):
             if filename.endswith(".csv"):
-                file_path = os.path.join(dataset_files_path, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as csvfile:
-                        reader = csv.reader(csvfile)
-                        header = next(reader)
-                        if "Form Name" in header:
-                            form_name_index = header.index("Form Name")
-                            try:
-                                first_row = next(reader)
-                                form_name = first_row[form_name_index]
-                                # Clean up the filename to use as a key
-                                clean_filename = os.path.splitext(filename)[0].replace('v_ALLALS_AS_', '').replace('v_ALLALS_PV_', '').replace('v_ALLALS_PR_', '').replace('-', '_')
-                                form_name_mapping[clean_filename] = form_name
-                            except StopIteration:
-                                print(f"File is empty (after header): {filename}")
-                        else:
-                            print(f"'Form Name' column not found in {filename}")
-                except Exception as e:
-                    print(f"Error processing file {filename}: {e}")
+                files.append((filename, os.path.join(dataset_files_path, filename)))
+
+    # Opening each file is I/O-bound, so overlap the reads with threads.
+    # map() keeps results in listing order so the mapping stays deterministic.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        results = list(pool.map(lambda f: _scan_form_name(*f), files))
+
+    for clean_filename, form_name, message in results:
+        if message:
+            print(message)
+        else:
+            form_name_mapping[clean_filename] = form_name
 
     return form_name_mapping
 
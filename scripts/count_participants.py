@@ -11,17 +11,31 @@ the CSV filename stem as the key matched against each entry's viewName field.
 """
 
 import argparse
+import csv
 import json
+import os
 import sys
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 
 TABULAR_EXTENSIONS = {".csv", ".tsv", ".xlsx", ".xls"}
 
 
-def read_tabular(path: Path) -> pd.DataFrame | None:
+def warn(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def read_tabular(path: Path, warn: Callable[[str], None] = warn) -> pd.DataFrame | None:
     """Read a tabular file (CSV, TSV, XLSX) into a DataFrame."""
     try:
         ext = path.suffix.lower()
@@ -32,36 +46,100 @@ def read_tabular(path: Path) -> pd.DataFrame | None:
         else:
             return pd.read_csv(path)
     except Exception as e:
-        print(f"WARNING: Could not read {path}: {e}", file=sys.stderr)
+        warn(f"WARNING: Could not read {path}: {e}")
+        return None
+
+
+def count_delimited_rows(
+    path: Path, delimiter: str = ",", warn: Callable[[str], None] = warn
+) -> int | None:
+    """Count data rows in a CSV/TSV by streaming records instead of loading a DataFrame.
+
+    Blank lines are skipped and quoted fields may span lines, matching
+    ``pd.read_csv`` row counts.
+    """
+    csv.field_size_limit(2**31 - 1)
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            total = sum(1 for row in csv.reader(f, delimiter=delimiter) if row)
+    except Exception as e:
+        warn(f"WARNING: Could not read {path}: {e}")
+        return None
+    if total == 0:
+        warn(f"WARNING: {path} is empty, skipping.")
         return None
+    return total - 1
+
 
+def count_lines(path: Path, chunk_size: int = 1 << 20) -> int:
+    """Count lines in a file by scanning raw bytes for newlines.
 
-def count_file(path: Path) -> int | None:
+    ``bytes.count`` runs in C, so this avoids per-line Python overhead. A
+    final line without a trailing newline still counts as a line.
+    """
+    total = 0
+    last = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            total += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last and last != b"\n":
+        total += 1
+    return total
+
+
+def count_file(path: Path, warn: Callable[[str], None] = warn) -> int | None:
     """Return the number of data rows in a file."""
     if not path.exists():
-        print(f"WARNING: File not found: {path}", file=sys.stderr)
+        warn(f"WARNING: File not found: {path}")
         return None
     if path.stat().st_size == 0:
-        print(f"WARNING: {path} is empty, skipping.", file=sys.stderr)
+        warn(f"WARNING: {path} is empty, skipping.")
         return None
 
     ext = path.suffix.lower()
+    if ext in (".csv", ".tsv"):
+        return count_delimited_rows(path, delimiter="\t" if ext == ".tsv" else ",", warn=warn)
     if ext in TABULAR_EXTENSIONS:
-        df = read_tabular(path)
+        df = read_tabular(path, warn=warn)
         return len(df) if df is not None else None
     else:
         # Plain text: count lines minus header
         try:
-            total = sum(1 for _ in open(path, encoding="utf-8"))
+            total = count_lines(path)
             if total == 0:
-                print(f"WARNING: {path} is empty, skipping.", file=sys.stderr)
+                warn(f"WARNING: {path} is empty, skipping.")
                 return None
             return total - 1
         except Exception as e:
-            print(f"WARNING: Could not read {path}: {e}", file=sys.stderr)
+            warn(f"WARNING: Could not read {path}: {e}")
             return None
 
 
+def count_file_collecting_warnings(path: Path) -> tuple[str, int | None, list[str]]:
+    """Count ``path`` and return its warnings instead of printing them.
+
+    Used from worker threads so that stderr output stays in input order.
+    """
+    warnings: list[str] = []
+    count = count_file(path, warn=warnings.append)
+    return path.name, count, warnings
+
+
+def count_files(paths: list[Path]) -> list[tuple[str, int | None]]:
+    """Count rows in each path concurrently, preserving input order."""
+    max_workers = min(32, (os.cpu_count() or 1) * 4, max(len(paths), 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        outcomes = list(ex.map(count_file_collecting_warnings, paths))
+
+    results: list[tuple[str, int | None]] = []
+    for name, count, warnings in outcomes:
+        for message in warnings:
+            warn(message)
+        results.append((name, count))
+    return results
+
+
 def collect_files(directory: Path, recursive: bool) -> list[Path]:
     """Return all supported tabular and .txt files in a directory."""
     pattern = "**/*" if recursive else "*"
@@ -141,17 +219,25 @@ def update_annotations(
     Matching: the CSV/TXT stem (e.g. ``v_ALLALS_AS_ASSEAELOG``) is compared
     against each annotation entry's ``viewName[0]`` value.
     """
-    with open(annotations_path) as f:
-        annotations = json.load(f)
+    raw = annotations_path.read_bytes()
+    try:
+        annotations = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:  # orjson rejects NaN literals that stdlib json accepts
+        annotations = json.loads(raw)
+
+    # Index entries by viewName once instead of probing every entry per count.
+    view_to_anns: dict[str, list[dict]] = defaultdict(list)
+    for file_info in annotations.values():
+        for ann in file_info.values():
+            view_names = ann.get("viewName")
+            if view_names and view_names[0]:
+                view_to_anns[view_names[0]].append(ann)
 
     updated = 0
-    for _syn_id, file_info in annotations.items():
-        for _title, ann in file_info.items():
-            view_names = ann.get("viewName") or []
-            view_name = view_names[0] if view_names else None
-            if view_name and view_name in counts:
-                ann[field] = [counts[view_name]]
-                updated += 1
+    for view_name, count in counts.items():
+        for ann in view_to_anns.get(view_name, ()):
+            ann[field] = [count]
+            updated += 1
 
     if dry_run:
         print(f"[dry-run] Would update {updated} entries in {annotations_path}")
@@ -251,7 +337,7 @@ def main() -> None:
         print(f"{'Unique across all files':<{col1}}  {unique_total:>{col2}}")
         return
 
-    results: list[tuple[str, int | None]] = [(p.name, count_file(p)) for p in paths]
+    results = count_files(paths)
     print_table(results)
 
     if args.update_annotations:
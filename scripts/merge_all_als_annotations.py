@@ -16,10 +16,14 @@ Run from the repository root so the relative paths resolve correctly.
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 
 ROOT = Path(__file__).resolve().parents[1]
 ANNOT_DIR = ROOT / "annotations" / "all_als"
@@ -27,11 +31,18 @@ BACKUP_DIR = ROOT / "annotations" / "all_als_backup"
 
 
 def load_json(path: Path) -> Any:
-    with path.open() as fh:
-        return json.load(fh)
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which only stdlib json accepts
+    return json.loads(raw)
 
 
 def dump_json(path: Path, payload: Any) -> None:
+    # Writes stay on stdlib json: orjson formats floats and non-ASCII text
+    # differently, which would churn the tracked annotation files.
     with path.open("w") as fh:
         json.dump(payload, fh, indent=2)
 
@@ -69,20 +80,21 @@ def build_lookups(backup: Dict[str, Dict[str, Dict[str, Any]]]) -> Tuple[
     by_view: Dict[Tuple[str, str], Dict[str, Any]] = {}
     by_title: Dict[str, List[Dict[str, Any]]] = {}
 
+    # The lookups share the backup's dicts; merge_file_annotations copies a
+    # candidate before normalizing it, so the backup itself is never mutated.
     for entry in backup.values():
         for title, meta in entry.items():
-            meta_copy = deepcopy(meta)
-            alt = meta_copy.get("alternateName") or ""
+            alt = meta.get("alternateName") or ""
             if alt:
-                by_alt[(title, alt)] = meta_copy
+                by_alt[(title, alt)] = meta
 
-            view = meta_copy.get("viewName") or []
+            view = meta.get("viewName") or []
             if isinstance(view, list):
                 for v in view:
                     if v:
-                        by_view[(title, v)] = meta_copy
+                        by_view[(title, v)] = meta
 
-            by_title.setdefault(title, []).append(meta_copy)
+            by_title.setdefault(title, []).append(meta)
 
     return by_alt, by_view, by_title
 
@@ -133,7 +145,9 @@ def merge_file_annotations(current_path: Path, backup_path: Path) -> None:
                 unmatched.append((title, alt, meta.get("viewName")))
                 candidate = meta
             else:
-                candidate = deepcopy(candidate)
+                # Shallow copy: only top-level keys are reassigned below, and a
+                # backup record may be matched by more than one current entry.
+                candidate = dict(candidate)
 
             candidate["disease"] = normalize_scalar(candidate.get("disease"))
             candidate["studyPhase"] = normalize_scalar(candidate.get("studyPhase"))
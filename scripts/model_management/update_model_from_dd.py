@@ -6,18 +6,90 @@ This script updates the data model from the data dictionaries.
 """
 
 import csv
+import functools
 import hashlib
+import io
 import json
 import os
+import pickle
 import re
 import signal
 import sys
 import argparse
+import atexit
 import subprocess
 import tempfile
-from difflib import SequenceMatcher
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:  # optional C implementation; difflib is the fallback
+    from difflib import SequenceMatcher
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:  # optional pre-filter only; scores always come from SequenceMatcher
+    rf_fuzz = rf_process = None
+
+try:
+    import orjson
+except ImportError:  # optional fast encoder; json is the fallback
+    orjson = None
+
+try:
+    import yaml as pyyaml
+except ImportError:  # optional fast reader; ruamel.yaml is the fallback
+    pyyaml = None
 from ruamel.yaml import YAML
 
+# Patterns applied per row while parsing data dictionaries and mappings.
+_VIEW_RE = re.compile(r'^(?:v|ct)_allals_(?:as|pr|pv)_[a-z0-9_]+$')
+_VIEW_FILENAME_RE = re.compile(r'^v_ALLALS_(?:AS|PR|PV)_[A-Z0-9_]+$', re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r'[^A-Za-z0-9]+')
+_NON_ALNUM_LOWER_RE = re.compile(r'[^a-z0-9]+')
+_VALUES_SPLIT_RE = re.compile(r'[;,]')
+_JSON_FENCE_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+_PLAIN_FENCE_RE = re.compile(r"```\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Concurrent Synapse downloads; keep modest to stay within Synapse rate limits.
+SYNAPSE_DOWNLOAD_WORKERS = max(1, int(os.getenv("SYNAPSE_DOWNLOAD_WORKERS", "8")))
+
+if pyyaml is not None:
+    _BaseSafeLoader = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
+
+    class _FastSafeLoader(_BaseSafeLoader):
+        """libyaml-backed loader that resolves booleans like ruamel's YAML 1.2.
+
+        PyYAML follows YAML 1.1, where yes/no/on/off are booleans; enum
+        members such as ``Yes:`` must stay strings to match the round-trip load.
+        """
+
+    _FastSafeLoader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag != "tag:yaml.org,2002:bool"]
+        for first, resolvers in _BaseSafeLoader.yaml_implicit_resolvers.items()
+    }
+    _FastSafeDumper = getattr(pyyaml, "CSafeDumper", pyyaml.SafeDumper)
+    _FastSafeLoader.add_implicit_resolver(
+        "tag:yaml.org,2002:bool",
+        re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+        list("tTfF"),
+    )
+
+# Read buffer for CSV inputs; large DDs need far fewer read() calls than with
+# the 8 KiB default. Overridable with --read-buffer-bytes.
+READ_BUFFER_BYTES = 1 << 20
+
+# Memoized AI responses, one JSON file per prompt; set from the checkpoint
+# location in main (None disables, see --no-ai-cache).
+AI_CACHE_DIR = None
+
+# One data-dictionary row; tuple storage keeps large DDs cheap to hold.
+FieldInfo = namedtuple("FieldInfo", "field description values")
+
 # --- Helper Functions ---
 
 def connect_to_synapse():
@@ -40,6 +112,8 @@ def connect_to_synapse():
         print("Connected to Synapse (using default credentials)")
     return syn
 
+# DD field names repeat across views and datasets.
+@functools.lru_cache(maxsize=65536, typed=True)
 def to_camel_case(snake_str):
     """Converts snake_case to camelCase."""
     if not snake_str:
@@ -47,76 +121,64 @@ def to_camel_case(snake_str):
     components = snake_str.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
 
+# Called per DD row and per enum member with highly repetitive inputs. typed=True
+# keeps e.g. True and 1 (equal as dict keys) from sharing a cache entry.
+@functools.lru_cache(maxsize=65536, typed=True)
 def normalize_view_name(view_name):
     """Normalize view names for robust matching."""
     return str(view_name).strip().lower()
 
+@functools.lru_cache(maxsize=65536, typed=True)
 def is_view_like_name(value):
     """Return True if a string looks like a view identifier."""
-    return bool(
-        re.match(
-            r'^(?:v|ct)_allals_(?:as|pr|pv)_[a-z0-9_]+$',
-            normalize_view_name(value),
-        )
-    )
+    return bool(_VIEW_RE.match(normalize_view_name(value)))
 
 def parse_data_dictionary(file_path):
     """Parses a data dictionary CSV file."""
     data = {}
-    current_view = None
+    # The C parser does the tokenizing. Fixed names pad short rows with "";
+    # usecols additionally drops fields past the fourth, but pandas rejects it
+    # when no row reaches four fields, so such files are re-read without it.
+    read_kwargs = dict(
+        header=None,
+        skiprows=1,
+        names=range(4),
+        dtype=str,
+        keep_default_na=False,
+        engine='c',
+    )
     try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.reader(f)
-            next(reader) # Skip header
-            for row in reader:
-                if not row or not any(row):
-                    continue
-                view_name = row[0].strip() if len(row) > 0 else ""
-                if view_name:
-                    current_view = view_name
-                    if current_view not in data:
-                        data[current_view] = []
-                
-                if current_view and len(row) > 1 and row[1]:
-                    field_info = {
-                        'field': row[1],
-                        'description': row[2] if len(row) > 2 else "",
-                        'values': row[3] if len(row) > 3 else ""
-                    }
-                    data[current_view].append(field_info)
-    except (IOError, StopIteration) as e:
+        with open(file_path, 'r', encoding='utf-8-sig', buffering=READ_BUFFER_BYTES) as f:
+            try:
+                df = pd.read_csv(f, usecols=range(4), **read_kwargs)
+            except pd.errors.ParserError:
+                f.seek(0)
+                df = pd.read_csv(f, **read_kwargs)
+    except (IOError, ValueError, pd.errors.EmptyDataError) as e:
+        # ValueError covers pd.errors.ParserError (e.g. malformed quoting).
         print(f"Error reading data dictionary {file_path}: {e}", file=sys.stderr)
+        return data
+
+    # A view name applies to its own row and every following row until the
+    # next one; views are keyed in first-appearance order, even when empty.
+    views = df[0].str.strip()
+    views = views.where(views != "").ffill()
+    for view_name in views.dropna().unique():
+        data[view_name] = []
+    keep = (views.notna() & (df[1] != "")).to_numpy()
+    kept = df[keep]
+    rows = zip(kept[1].tolist(), kept[2].tolist(), kept[3].tolist())
+    for view_name, field_info in zip(views[keep].tolist(), map(FieldInfo._make, rows)):
+        data[view_name].append(field_info)
     return data
 
-def parse_view_to_class_mapping(file_path):
-    """Parses the view_to_class_mapping.md file."""
-    mapping = {}
-    try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                if "|" not in line:
-                    continue
-                parts = [p.strip().strip("`") for p in line.split("|")[1:-1]]
-                if len(parts) < 2:
-                    continue
-                view_name = parts[0]
-                # Supports both:
-                # 1) | view_name | class_name |
-                # 2) | view_name | form_name | class_name |
-                class_name = parts[2] if len(parts) >= 3 else parts[1]
-                class_name = class_name.split("(")[0].strip()
-                if not view_name or not class_name:
-                    continue
-                if not re.match(r'^(?:v|ct)_allals_(?:as|pr|pv)_[a-z0-9_]+$', normalize_view_name(view_name)):
-                    continue
-                mapping[normalize_view_name(view_name)] = class_name
-    except IOError as e:
-        print(f"Error reading mapping file {file_path}: {e}", file=sys.stderr)
-    return mapping
+def parse_view_mappings(file_path):
+    """Parse the view_to_class_mapping.md table in one pass.
 
-def parse_view_to_form_name_mapping(file_path):
-    """Parse markdown mapping and return normalized view_name -> form_name."""
-    mapping = {}
+    Returns (normalized view_name -> class_name, normalized view_name -> form_name).
+    """
+    view_to_class = {}
+    view_to_form_name = {}
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             for line in f:
@@ -126,17 +188,25 @@ def parse_view_to_form_name_mapping(file_path):
                 if len(parts) < 2:
                     continue
                 view_name = parts[0]
-                # For 3-column format this is form name; for 2-column fallback this may be class name.
-                form_name = parts[1]
-                if not view_name or not form_name:
+                if not view_name:
                     continue
                 norm_view = normalize_view_name(view_name)
-                if not re.match(r'^(?:v|ct)_allals_(?:as|pr|pv)_[a-z0-9_]+$', norm_view):
+                if not _VIEW_RE.match(norm_view):
                     continue
-                mapping[norm_view] = form_name
+                # Supports both:
+                # 1) | view_name | class_name |
+                # 2) | view_name | form_name | class_name |
+                # For the 2-column format the "form name" is the class name.
+                class_name = parts[2] if len(parts) >= 3 else parts[1]
+                class_name = class_name.split("(", 1)[0].strip()
+                if class_name:
+                    view_to_class[norm_view] = class_name
+                form_name = parts[1]
+                if form_name:
+                    view_to_form_name[norm_view] = form_name
     except IOError as e:
         print(f"Error reading mapping file {file_path}: {e}", file=sys.stderr)
-    return mapping
+    return view_to_class, view_to_form_name
 
 def derive_view_name_from_filename(filename):
     """
@@ -144,13 +214,14 @@ def derive_view_name_from_filename(filename):
     v_ALLALS_AS_ASSEDEMOG.csv -> v_ALLALS_AS_ASSEDEMOG
     """
     base = os.path.splitext(os.path.basename(filename))[0]
-    if re.match(r'^v_ALLALS_(?:AS|PR|PV)_[A-Z0-9_]+$', base, re.IGNORECASE):
+    if _VIEW_FILENAME_RE.match(base):
         return base.upper()
     return None
 
+@functools.lru_cache(maxsize=65536, typed=True)
 def form_name_to_class_name(form_name):
     """Convert a form name into a LinkML-friendly PascalCase class name."""
-    cleaned = re.sub(r'[^A-Za-z0-9]+', ' ', str(form_name)).strip()
+    cleaned = _NON_ALNUM_RE.sub(' ', str(form_name)).strip()
     if not cleaned:
         return ""
     parts = [p for p in cleaned.split() if p]
@@ -162,7 +233,7 @@ def form_name_to_class_name(form_name):
 def extract_form_name_from_csv(file_path):
     """Extract form_name or Form Name value from first data row of a CSV."""
     try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
+        with open(file_path, 'r', encoding='utf-8-sig', buffering=READ_BUFFER_BYTES) as f:
             reader = csv.reader(f)
             header = next(reader)
             if not header:
@@ -194,43 +265,48 @@ def extract_form_name_from_csv(file_path):
     except Exception as e:
         return None, str(e)
 
-def download_folder_csvs(syn, folder_id, dataset_label, downloads_dir):
-    """Download all CSV files from a Synapse folder to downloads/<dataset_label>."""
+def submit_folder_csv_downloads(syn, folder_id, dataset_label, downloads_dir, executor):
+    """Queue downloads of all CSV files in a Synapse folder to downloads/<dataset_label>.
+
+    Returns (child, future) pairs in listing order; pass them to collect_csv_downloads.
+    """
     target_dir = os.path.join(downloads_dir, dataset_label)
     os.makedirs(target_dir, exist_ok=True)
 
-    downloaded_files = []
     children = list(syn.getChildren(folder_id, includeTypes=["file"]))
-    for child in children:
-        file_name = child.get("name", "")
-        if not file_name.lower().endswith(".csv"):
-            continue
+    csv_children = [
+        child for child in children
+        if child.get("name", "").lower().endswith(".csv")
+    ]
+    return [
+        (child, executor.submit(syn.get, child["id"], downloadLocation=target_dir))
+        for child in csv_children
+    ]
 
-        syn_id = child["id"]
+def collect_csv_downloads(pending):
+    """Wait for queued downloads; return local paths in listing order, warning on failures."""
+    downloaded_files = []
+    for child, future in pending:
         try:
-            entity = syn.get(syn_id, downloadLocation=target_dir)
-            downloaded_files.append(entity.path)
+            downloaded_files.append(future.result().path)
         except Exception as e:
-            print(f"Warning: Failed to download {syn_id} ({file_name}): {e}", file=sys.stderr)
-
+            print(
+                f"Warning: Failed to download {child['id']} ({child.get('name', '')}): {e}",
+                file=sys.stderr,
+            )
     return downloaded_files
 
 def write_view_to_class_markdown(mapping_rows, output_path):
     """Write generated view->form->class mapping to a markdown table."""
-    lines = [
-        "# View to Class Mapping\n",
-        "\n",
-        "| View Name | Form Name | Class Name |\n",
-        "| --- | --- | --- |\n",
-    ]
-
-    for row in sorted(mapping_rows, key=lambda r: r["view_name"]):
-        lines.append(
-            f"| `{row['view_name']}` | `{row['form_name']}` | `{row['class_name']}` |\n"
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(
+            "# View to Class Mapping\n"
+            "\n"
+            "| View Name | Form Name | Class Name |\n"
+            "| --- | --- | --- |\n"
         )
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        for row in sorted(mapping_rows, key=lambda r: r["view_name"]):
+            f.write(f"| `{row['view_name']}` | `{row['form_name']}` | `{row['class_name']}` |\n")
 
 def generate_view_to_class_mapping_from_synapse(assess_folder_id, prevent_folder_id, downloads_dir, output_path):
     """Download staging CSVs and generate a markdown mapping file."""
@@ -248,9 +324,18 @@ def generate_view_to_class_mapping_from_synapse(assess_folder_id, prevent_folder
         ("PREVENT", prevent_folder_id),
     ]
 
-    for dataset_label, folder_id in folder_specs:
-        print(f"Downloading CSVs from {dataset_label} staging folder: {folder_id}")
-        csv_files = download_folder_csvs(syn, folder_id, dataset_label, downloads_dir)
+    # Downloads are network-bound; both folders share one pool so that
+    # SYNAPSE_DOWNLOAD_WORKERS bounds the total number of concurrent syn.get calls.
+    with ThreadPoolExecutor(max_workers=SYNAPSE_DOWNLOAD_WORKERS) as ex:
+        folder_downloads = []
+        for dataset_label, folder_id in folder_specs:
+            print(f"Downloading CSVs from {dataset_label} staging folder: {folder_id}")
+            folder_downloads.append(
+                submit_folder_csv_downloads(syn, folder_id, dataset_label, downloads_dir, ex)
+            )
+        folder_files = [collect_csv_downloads(pending) for pending in folder_downloads]
+
+    for (dataset_label, folder_id), csv_files in zip(folder_specs, folder_files):
         print(f"  Downloaded {len(csv_files)} CSV file(s) to {os.path.join(downloads_dir, dataset_label)}")
 
         for file_path in csv_files:
@@ -311,9 +396,14 @@ def resolve_data_dictionary_paths(args):
             "ASSESS": args.assess_dd_synid,
             "PREVENT": args.prevent_dd_synid,
         }
+        with ThreadPoolExecutor(max_workers=len(synid_map)) as ex:
+            downloads = {
+                dataset: ex.submit(syn.get, syn_id, downloadLocation=dd_dir)
+                for dataset, syn_id in synid_map.items()
+            }
         for dataset, syn_id in synid_map.items():
             try:
-                entity = syn.get(syn_id, downloadLocation=dd_dir)
+                entity = downloads[dataset].result()
                 dd_paths[dataset] = entity.path
                 print(f"  Downloaded {dataset} DD: {entity.path}")
             except Exception as e:
@@ -348,19 +438,24 @@ def infer_class_description(view_name, form_name):
     return str(view_name).strip()
 
 def add_merge_note_to_class_description(class_def, mapped_class_name, view_name, form_name):
-    """Append an idempotent merge note when a view/class is merged into an existing class."""
+    """Append an idempotent merge note when a view/class is merged into an existing class.
+
+    Returns True if the description changed.
+    """
     merge_label = str(form_name).strip() if form_name and str(form_name).strip() else mapped_class_name
     note = f"Merged source: {merge_label} ({view_name})"
 
     existing_desc = str(class_def.get("description", "") or "").strip()
-    if note in existing_desc:
-        return
+    if existing_desc == note or note in existing_desc:
+        return False
 
     if existing_desc:
         class_def["description"] = f"{existing_desc}\n{note}"
     else:
         class_def["description"] = note
+    return True
 
+@functools.lru_cache(maxsize=65536, typed=True)
 def normalize_value_token(value):
     if not value:
         return ""
@@ -368,20 +463,39 @@ def normalize_value_token(value):
 
 def parse_values_column(values_str):
     """Split raw DD values into cleaned tokens."""
-    if not values_str or not str(values_str).strip():
+    if not values_str:
         return []
-    tokens = re.split(r'[;,]', str(values_str))
-    cleaned = [t.strip() for t in tokens if t and t.strip()]
-    return cleaned
+    return [t for t in (x.strip() for x in _VALUES_SPLIT_RE.split(str(values_str))) if t]
 
+# DD value lists repeat heavily (Yes/No lists on thousands of fields).
+@functools.lru_cache(maxsize=4096)
+def parse_values_cached(values_str):
+    """Return (tokens, normalized value set) for a raw DD values string."""
+    values = tuple(parse_values_column(values_str))
+    return values, frozenset(normalize_value_token(v) for v in values)
+
+_STRICT_BOOLEAN_TOKENS = frozenset({"true", "false"})
+_NORMALIZED_BOOLEAN_TOKENS = frozenset({"true", "false", "yes", "no", "y", "n", "1", "0"})
+
+@functools.lru_cache(maxsize=4096)
 def is_boolean_values(values, rule):
-    tokens = {normalize_value_token(v) for v in values}
+    """Whether the tokens form a boolean under ``rule``; ``values`` must be a tuple."""
+    if rule == "strict":
+        allowed = _STRICT_BOOLEAN_TOKENS
+    elif rule == "normalize":
+        allowed = _NORMALIZED_BOOLEAN_TOKENS
+    else:
+        return False
+    # Stop at the first non-boolean token instead of normalizing every value.
+    seen = set()
+    for value in values:
+        token = normalize_value_token(value)
+        if token not in allowed:
+            return False
+        seen.add(token)
     if rule == "strict":
-        return tokens == {"true", "false"}
-    if rule == "normalize":
-        normalized = {"true", "false", "yes", "no", "y", "n", "1", "0"}
-        return tokens.issubset(normalized) and tokens
-    return False
+        return seen == _STRICT_BOOLEAN_TOKENS
+    return bool(seen)
 
 def compute_args_signature(args, proposal_path):
     relevant = {
@@ -395,19 +509,112 @@ def compute_args_signature(args, proposal_path):
     serialized = json.dumps(relevant, sort_keys=True)
     return hashlib.sha256(serialized.encode()).hexdigest()
 
+# Per-item progress is appended to a JSONL sidecar; the full checkpoint is only
+# rewritten (and the sidecar truncated) once this many keys have been appended
+# since the last rewrite, and at the end.
+CHECKPOINT_COMPACT_EVERY = 200
+
+# Assess mode flushes the proposal CSV and records progress every this many rows.
+FLUSH_BATCH = 50
+
+# Apply mode writes edited YAML and records progress every this many items;
+# kept small because each item may carry an interactive review decision.
+APPLY_FLUSH_EVERY = 10
+
+def checkpoint_delta_path(path):
+    return path + ".jsonl"
+
+def _loads_json(raw):
+    """Parse JSON text or UTF-8 bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def load_checkpoint(path):
-    if not path or not os.path.exists(path):
-        return {}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+    if not path:
         return {}
+    data = {}
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                data = _loads_json(f.read())
+        except Exception:
+            data = {}
+
+    delta_path = checkpoint_delta_path(path)
+    if os.path.exists(delta_path):
+        modes = data.setdefault("modes", {})
+        replayed = {}
+        with open(delta_path, "rb") as f:
+            for line in f:
+                try:
+                    delta = _loads_json(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted append
+                mode_state = modes.setdefault(delta["mode"], {})
+                keys = replayed.get(delta["mode"])
+                if keys is None:
+                    keys = replayed[delta["mode"]] = set(mode_state.get("completed_keys", []))
+                keys.update(delta["completed_keys"])
+                mode_state["processed_count"] = delta["processed_count"]
+                mode_state["args_signature"] = delta["args_signature"]
+        for mode, keys in replayed.items():
+            modes[mode]["completed_keys"] = sorted(keys)
+    return data
 
 def save_checkpoint(path, data):
+    """Write the full checkpoint and drop the delta sidecar it now covers."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        if orjson is not None:
+            f.write(orjson.dumps(data))
+        else:
+            f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+    os.replace(tmp_path, path)
+    delta_path = checkpoint_delta_path(path)
+    if os.path.exists(delta_path):
+        os.remove(delta_path)
+
+def append_checkpoint_delta(path, mode, new_keys, processed_count, args_signature):
+    """Record progress since the last write without rewriting the checkpoint."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    delta = {
+        "mode": mode,
+        "completed_keys": list(new_keys),
+        "processed_count": processed_count,
+        "args_signature": args_signature,
+    }
+    with open(checkpoint_delta_path(path), "a", encoding="utf-8") as f:
+        f.write(dumps_compact(delta) + "\n")
+
+def persist_mode_checkpoint(
+    args,
+    checkpoint_root,
+    mode_checkpoint,
+    args_signature,
+    completed_keys,
+    new_keys,
+    processed_count,
+    compact=False,
+    final=False,
+):
+    """Persist mode progress: a sidecar delta normally, a full rewrite when compacting.
+
+    ``new_keys`` lists keys completed since the previous call and is cleared.
+    Keys are only sorted on the ``final`` write; order does not matter on load.
+    """
+    if compact or final:
+        mode_checkpoint["completed_keys"] = sorted(completed_keys) if final else list(completed_keys)
+        mode_checkpoint["processed_count"] = processed_count
+        mode_checkpoint["args_signature"] = args_signature
+        checkpoint_root["modes"][args.mode] = mode_checkpoint
+        save_checkpoint(args.checkpoint_path, checkpoint_root)
+    else:
+        append_checkpoint_delta(
+            args.checkpoint_path, args.mode, new_keys, processed_count, args_signature
+        )
+    new_keys.clear()
 
 stop_requested = False
 
@@ -435,6 +642,12 @@ PROPOSAL_COLUMNS = [
 ]
 
 
+def dumps_compact(obj):
+    """Serialize JSON without whitespace or ASCII escaping (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 def compute_item_key(view_name, field_name, target_class):
     return f"{normalize_view_name(view_name)}|{field_name}|{normalize_class_name(target_class)}"
 
@@ -444,12 +657,11 @@ def load_existing_proposal_keys(path):
         return set()
     keys = set()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                key = row.get("item_key")
-                if key:
-                    keys.add(key)
+        with open(path, "r", encoding="utf-8", buffering=READ_BUFFER_BYTES) as f:
+            # Only item_key is needed; skip building a dict per row.
+            reader = csv.reader(f)
+            idx = next(reader).index("item_key")
+            keys.update(row[idx] for row in reader if len(row) > idx and row[idx])
     except Exception:
         pass
     return keys
@@ -491,28 +703,40 @@ def build_enum_catalog(yaml_files):
     return catalog
 
 
-def find_matching_enum(values, catalog):
-    target_set = frozenset(normalize_value_token(v) for v in values)
-    if not target_set:
-        return None
+def build_enum_value_index(catalog):
+    """Index catalog entries by value set; the first entry wins, as in a linear scan."""
+    index = {}
     for entry in catalog:
-        if entry["value_set"] == target_set:
-            return entry
-    return None
+        index.setdefault(entry["value_set"], entry)
+    return index
 
 
-def suggest_enum_name(class_name, attribute_name, existing_names):
+def find_matching_enum(value_set, enum_index):
+    """Return the catalog entry with exactly ``value_set`` (see parse_values_cached)."""
+    if not value_set:
+        return None
+    return enum_index.get(value_set)
+
+
+def suggest_enum_name(class_name, attribute_name, existing_names, base_counters=None):
+    """Pick an unused ``<Base>Values[N]`` name and add it to ``existing_names``.
+
+    ``base_counters`` remembers the last suffix used per base for the same
+    ``existing_names`` set, so repeated collisions do not re-probe from 1.
+    """
     parts = []
     for value in (class_name, attribute_name):
-        cleaned = re.sub(r"[^A-Za-z0-9]+", "", value.title())
+        cleaned = _NON_ALNUM_RE.sub("", value.title())
         if cleaned:
             parts.append(cleaned)
     base = "".join(parts) or "Attribute"
-    name = f"{base}Values"
-    counter = 1
+    counter = base_counters.get(base, 1) if base_counters is not None else 1
+    name = f"{base}Values" if counter == 1 else f"{base}Values{counter}"
     while name in existing_names:
         counter += 1
         name = f"{base}Values{counter}"
+    if base_counters is not None:
+        base_counters[base] = counter
     existing_names.add(name)
     return name
 
@@ -530,7 +754,7 @@ def ensure_enum_definition(yaml_files, target_file, enum_name, values):
         return
     members = []
     for value in values:
-        cleaned = re.sub(r"[^A-Za-z0-9]+", "_", value.strip()).strip("_").lower()
+        cleaned = _NON_ALNUM_RE.sub("_", value.strip()).strip("_").lower()
         member_name = cleaned or "value"
         members.append({"name": member_name, "description": value})
     enums[enum_name] = {"description": f"Values for {enum_name}", "permissible_values": members}
@@ -544,26 +768,26 @@ def determine_attribute_range(
     target_file,
     yaml_files,
     enum_catalog,
+    enum_index,
     existing_enum_names,
+    enum_base_counters=None,
 ):
-    values = parse_values_column(field.get("values", ""))
+    values, value_set = parse_values_cached(field.values)
     if not values:
         return base_range, "none", None
     if is_boolean_values(values, args.boolean_rule):
         return "boolean", "boolean", None
     if args.enum_strategy == "keep-string":
         return base_range, "none", None
-    normalized_values = [v for v in values if v]
-    if not normalized_values:
-        return "string", "none", None
-    value_set = frozenset(normalize_value_token(v) for v in normalized_values)
+    # parse_values_column already drops empty tokens.
+    normalized_values = list(values)
     matching_enum = None
     if args.enum_strategy == "reuse-first":
-        matching_enum = find_matching_enum(normalized_values, enum_catalog)
+        matching_enum = find_matching_enum(value_set, enum_index)
     if matching_enum and args.enum_strategy == "reuse-first":
         return matching_enum["name"], "reuse", matching_enum
     enum_name = suggest_enum_name(
-        target_class_name, to_camel_case(field.get("field", "")), existing_enum_names
+        target_class_name, to_camel_case(field.field), existing_enum_names, enum_base_counters
     )
     ensure_enum_definition(yaml_files, target_file, enum_name, normalized_values)
     new_entry = {
@@ -573,6 +797,7 @@ def determine_attribute_range(
         "raw_values": normalized_values,
     }
     enum_catalog.append(new_entry)
+    enum_index.setdefault(value_set, new_entry)
     existing_enum_names.add(enum_name)
     return enum_name, "create", new_entry
 
@@ -590,30 +815,100 @@ def open_proposal_writer(path, resume):
 
 
 def _replace_class_reference_in_attr(attr_def, old_class_name, new_class_name):
-    """Replace class references in a LinkML attribute-like object."""
-    if not isinstance(attr_def, dict):
-        return
+    """Replace class references in a LinkML attribute-like object.
+
+    Returns True if any reference was changed.
+    """
+    if not isinstance(attr_def, dict) or old_class_name == new_class_name:
+        return False
+    changed = False
     if attr_def.get("range") == old_class_name:
         attr_def["range"] = new_class_name
+        changed = True
     any_of = attr_def.get("any_of")
     if isinstance(any_of, list):
         for option in any_of:
             if isinstance(option, dict) and option.get("range") == old_class_name:
                 option["range"] = new_class_name
+                changed = True
+    return changed
+
+# Lookup tables over every class in yaml_files. ``flat`` holds
+# (path, class_name, norm, stem) in yaml_files order (None once removed); the
+# dicts map exact name, lowercased name, normalized name and stem to ascending
+# positions in ``flat``, so the first live position is the linear-scan hit.
+ClassIndex = namedtuple("ClassIndex", "exact lower norm stem flat")
+
+def build_class_index(yaml_files):
+    """Index every class in yaml_files for exact, loose and fuzzy lookups."""
+    class_index = ClassIndex({}, {}, {}, {}, [])
+    for path, data in yaml_files.items():
+        if not data or not data.get("classes"):
+            continue
+        for class_name in data["classes"]:
+            add_to_class_index(class_index, path, class_name)
+    return class_index
+
+def add_to_class_index(class_index, path, class_name):
+    """Record a class created after the index was built."""
+    norm = normalize_class_name(class_name)
+    stem = class_name_stem(class_name)
+    pos = len(class_index.flat)
+    class_index.flat.append((path, class_name, norm, stem))
+    class_index.exact.setdefault(class_name, []).append(pos)
+    class_index.lower.setdefault(str(class_name).lower(), []).append(pos)
+    if norm:
+        # Classes without a normalized name never take part in loose matching.
+        class_index.norm.setdefault(norm, []).append(pos)
+        class_index.stem.setdefault(stem, []).append(pos)
+
+def remove_from_class_index(class_index, path, class_name):
+    """Forget a class that was renamed or removed."""
+    for pos in class_index.exact.get(class_name, []):
+        if class_index.flat[pos][0] == path:
+            break
+    else:
+        return
+    _, _, norm, stem = class_index.flat[pos]
+    class_index.flat[pos] = None
+    keys = [(class_index.exact, class_name), (class_index.lower, str(class_name).lower())]
+    if norm:
+        keys += [(class_index.norm, norm), (class_index.stem, stem)]
+    for table, key in keys:
+        positions = table[key]
+        positions.remove(pos)
+        if not positions:
+            del table[key]
+
+def _first_indexed_class(yaml_files, class_index, table, key):
+    positions = table.get(key)
+    if not positions:
+        return None
+    path, class_name, _, _ = class_index.flat[positions[0]]
+    return path, class_name, yaml_files[path]["classes"][class_name]
 
-def rename_class_and_references(yaml_files, old_class_name, new_class_name):
+def _iter_indexed_classes(class_index):
+    """Yield live (path, class_name, norm, stem) entries in index order."""
+    return (entry for entry in class_index.flat if entry is not None)
+
+def rename_class_and_references(yaml_files, old_class_name, new_class_name, class_index=None):
     """
     Rename an existing class key and update common class references across model files.
     Returns (renamed, renamed_path, renamed_class_def, touched_paths, message).
+    When ``class_index`` is given it is used for lookups and kept up to date.
     """
     if old_class_name == new_class_name:
         return False, None, None, [], "old_and_new_class_names_are_same"
 
-    old_path, old_existing_name, old_class_def = find_class_in_yaml(yaml_files, old_class_name, loose=True)
+    old_path, old_existing_name, old_class_def = find_class_in_yaml(
+        yaml_files, old_class_name, loose=True, class_index=class_index
+    )
     if not old_path:
         return False, None, None, [], "source_class_not_found"
 
-    new_path, new_existing_name, _ = find_class_in_yaml(yaml_files, new_class_name, loose=False)
+    new_path, new_existing_name, _ = find_class_in_yaml(
+        yaml_files, new_class_name, loose=False, class_index=class_index
+    )
     if new_path and normalize_class_name(new_existing_name) != normalize_class_name(old_existing_name):
         return False, None, None, [], "target_class_name_already_exists"
 
@@ -621,6 +916,9 @@ def rename_class_and_references(yaml_files, old_class_name, new_class_name):
     moved_def = classes_block.pop(old_existing_name)
     classes_block[new_class_name] = moved_def
     touched_paths = {old_path}
+    if class_index is not None:
+        remove_from_class_index(class_index, old_path, old_existing_name)
+        add_to_class_index(class_index, old_path, new_class_name)
 
     for path, data in yaml_files.items():
         if not isinstance(data, dict):
@@ -644,79 +942,237 @@ def rename_class_and_references(yaml_files, old_class_name, new_class_name):
                         touched_paths.add(path)
                 attrs = class_def.get("attributes")
                 if isinstance(attrs, dict):
-                    before = json.dumps(attrs, sort_keys=True, default=str)
                     for _, attr_def in attrs.items():
-                        _replace_class_reference_in_attr(attr_def, old_existing_name, new_class_name)
-                    after = json.dumps(attrs, sort_keys=True, default=str)
-                    if before != after:
-                        touched_paths.add(path)
+                        if _replace_class_reference_in_attr(attr_def, old_existing_name, new_class_name):
+                            touched_paths.add(path)
 
         slots = data.get("slots")
         if isinstance(slots, dict):
-            before = json.dumps(slots, sort_keys=True, default=str)
             for _, slot_def in slots.items():
-                _replace_class_reference_in_attr(slot_def, old_existing_name, new_class_name)
-            after = json.dumps(slots, sort_keys=True, default=str)
-            if before != after:
-                touched_paths.add(path)
+                if _replace_class_reference_in_attr(slot_def, old_existing_name, new_class_name):
+                    touched_paths.add(path)
 
     return True, old_path, moved_def, sorted(touched_paths), "renamed"
 
-def load_yaml_files(modules_dir):
-    """Loads all YAML files from the modules directory."""
+# Below this many files, process start-up costs more than parallel parsing saves.
+PARALLEL_YAML_LOAD_MIN_FILES = 64
+
+# Parsed-YAML cache kept next to the checkpoint file.
+YAML_CACHE_FILENAME = "yaml_cache.pkl"
+
+
+def _load_yaml_file_round_trip(file_path):
+    """Parse one YAML file with ruamel (comments kept); returns (path, data, error message)."""
+    try:
+        with open(file_path, 'r') as f:
+            return file_path, YAML().load(f), None
+    except Exception as e:
+        return file_path, None, f"Error loading YAML file {file_path}: {e}"
+
+def _load_yaml_file_fast(file_path):
+    """Parse one YAML file with libyaml; returns (path, data, error message)."""
+    try:
+        with open(file_path, 'r') as f:
+            return file_path, pyyaml.load(f, Loader=_FastSafeLoader), None
+    except Exception as e:
+        return file_path, None, f"Error loading YAML file {file_path}: {e}"
+
+
+def _iter_yaml_entries(directory):
+    """Yield YAML file DirEntry objects in os.walk order (a directory's files before its subdirectories)."""
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, list symlinked directories but do not descend.
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith((".yaml", ".yml")):
+                    yield entry
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_yaml_entries(subdir)
+
+
+def load_yaml_cache(cache_path):
+    """Return the parsed-YAML cache, or an empty one if missing or unreadable."""
+    try:
+        with open(cache_path, "rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_yaml_cache(cache_path, cache):
+    """Atomically replace the parsed-YAML cache."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+def load_yaml_files(modules_dir, round_trip=True, cache_path=None):
+    """Loads all YAML files from the modules directory.
+
+    Set ``round_trip=False`` for read-only passes: files are then parsed with
+    libyaml into plain dicts, which is much faster but drops the comments and
+    formatting ruamel keeps for write-back.
+
+    With ``cache_path``, files whose mtime and size match the cache are
+    unpickled instead of re-parsed, and the cache is refreshed afterwards.
+    """
+    entries = list(_iter_yaml_entries(modules_dir))
+    paths = [entry.path for entry in entries]
+    if not cache_path:
+        return _parse_yaml_files(paths, round_trip)
+
+    cache = load_yaml_cache(cache_path)
+    stats = {}
+    cached = {}
+    misses = []
+    for dir_entry in entries:
+        file_path = dir_entry.path
+        try:
+            # DirEntry caches its stat result (and gets it from the listing on Windows).
+            st = dir_entry.stat()
+        except OSError:
+            misses.append(file_path)
+            continue
+        stats[file_path] = (st.st_mtime_ns, st.st_size)
+        entry = cache.get((file_path, round_trip))
+        if entry is not None and entry[0] == stats[file_path]:
+            cached[file_path] = entry[1]
+        else:
+            misses.append(file_path)
+
+    parsed = _parse_yaml_files(misses, round_trip) if misses else {}
     yaml_data = {}
-    yaml = YAML()
-    for root, _, files in os.walk(modules_dir):
-        for file in files:
-            if file.endswith(".yaml") or file.endswith(".yml"):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r') as f:
-                        yaml_data[file_path] = yaml.load(f)
-                except Exception as e:
-                    print(f"Error loading YAML file {file_path}: {e}", file=sys.stderr)
+    for file_path in paths:
+        if file_path in cached:
+            yaml_data[file_path] = cached[file_path]
+        elif file_path in parsed:
+            yaml_data[file_path] = parsed[file_path]
+
+    if parsed or len(cached) != sum(1 for key in cache if key[1] == round_trip):
+        # Keep the other loader's entries for files that still exist.
+        live = set(paths)
+        new_cache = {key: entry for key, entry in cache.items() if key[1] != round_trip and key[0] in live}
+        for file_path, data in yaml_data.items():
+            if file_path in stats:
+                new_cache[(file_path, round_trip)] = (stats[file_path], data)
+        try:
+            save_yaml_cache(cache_path, new_cache)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"Warning: Could not write YAML cache {cache_path}: {e}", file=sys.stderr)
     return yaml_data
 
+def _parse_yaml_files(paths, round_trip):
+    """Parse the given YAML files, keyed by path in input order.
+
+    Large sets are parsed in worker processes on multi-core machines; both
+    parsers hold the GIL, so threads would not help.
+    """
+    if round_trip or pyyaml is None:
+        loader = _load_yaml_file_round_trip
+    else:
+        loader = _load_yaml_file_fast
+
+    results = None
+    if len(paths) >= PARALLEL_YAML_LOAD_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as ex:
+                results = list(ex.map(loader, paths, chunksize=4))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel YAML load failed ({e}); loading serially.", file=sys.stderr)
+    if results is None:
+        results = [loader(file_path) for file_path in paths]
+
+    yaml_data = {}
+    for file_path, data, error in results:
+        if error:
+            print(error, file=sys.stderr)
+            continue
+        yaml_data[file_path] = data
+    return yaml_data
+
+@functools.lru_cache(maxsize=None)
 def check_gemini_available():
-    """Check if gemini CLI is available."""
+    """Check if gemini CLI is available (probed once per run)."""
     try:
         result = subprocess.run(["gemini", "--version"], capture_output=True, text=True, timeout=5)
         return result.returncode == 0 or "gemini" in (result.stdout + result.stderr).lower()
     except Exception:
         return False
 
+@functools.lru_cache(maxsize=None)
 def check_codex_available():
-    """Check if codex CLI is available."""
+    """Check if codex CLI is available (probed once per run)."""
     try:
         result = subprocess.run(["codex", "--help"], capture_output=True, text=True, timeout=5)
         return result.returncode == 0 or "codex" in (result.stdout + result.stderr).lower()
     except Exception:
         return False
 
+def prewarm_cli_checks(checks):
+    """Run the given availability probes concurrently so later calls hit the cache."""
+    if len(checks) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+        list(ex.map(lambda check: check(), checks))
+
+def _first_json_object(text):
+    """Return the first balanced ``{...}`` in ``text`` that parses as JSON.
+
+    A single linear scan that skips braces inside JSON strings, used instead of
+    a greedy DOTALL regex over the whole model output.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, c in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = depth > 0
+        elif c == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(text[start:i + 1])
+                except json.JSONDecodeError:
+                    start = -1
+    return None
+
 def _parse_json_from_model_output(output):
     """Parse JSON payload from model output."""
     if not output:
         return None
     output = output.strip()
     if "```json" in output:
-        m = re.search(r"```json\s*(\{.*?\})\s*```", output, re.DOTALL)
+        m = _JSON_FENCE_RE.search(output)
         if m:
             output = m.group(1)
     elif "```" in output:
-        m = re.search(r"```\s*(\{.*?\})\s*```", output, re.DOTALL)
+        m = _PLAIN_FENCE_RE.search(output)
         if m:
             output = m.group(1)
 
     try:
         return json.loads(output)
     except json.JSONDecodeError:
-        m = re.search(r"\{.*\}", output, re.DOTALL)
-        if m:
-            try:
-                return json.loads(m.group(0))
-            except json.JSONDecodeError:
-                return None
-    return None
+        return _first_json_object(output)
 
 def run_gemini_json(prompt, timeout=60):
     """Run gemini CLI and parse JSON response."""
@@ -796,13 +1252,49 @@ def run_codex_json(prompt, timeout=60):
                 pass
     return None
 
-def run_ai_json(prompt, provider="gemini", timeout=60, use_codex_fallback=False, codex_timeout=60):
+def _ai_cache_path(prompt, provider, use_codex_fallback):
+    key = hashlib.blake2b(
+        json.dumps([provider, use_codex_fallback, prompt]).encode("utf-8"), digest_size=20
+    ).hexdigest()
+    return os.path.join(AI_CACHE_DIR, provider, f"{key}.json")
+
+def run_ai_json(
+    prompt, provider="gemini", timeout=60, use_codex_fallback=False, codex_timeout=60, use_cache=True
+):
     """
     Run AI suggestion call(s) and return parsed JSON.
     Provider can be "gemini" or "codex".
     If provider is gemini, optional codex fallback can be enabled.
     Returns (parsed_json_or_none, source_label).
+
+    Successful answers are memoized under AI_CACHE_DIR keyed by the exact
+    prompt, so re-runs and identical views skip the CLI round trip.
     """
+    cache_path = None
+    if use_cache and AI_CACHE_DIR:
+        cache_path = _ai_cache_path(prompt, provider, use_codex_fallback)
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            return cached["parsed"], cached["source"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    parsed, source = _run_ai_json_uncached(
+        prompt, provider, timeout, use_codex_fallback, codex_timeout
+    )
+    if cache_path and isinstance(parsed, dict):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"parsed": parsed, "source": source}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write AI cache {cache_path}: {e}", file=sys.stderr)
+    return parsed, source
+
+def _run_ai_json_uncached(prompt, provider, timeout, use_codex_fallback, codex_timeout):
     if provider == "codex":
         parsed_codex = run_codex_json(prompt, timeout=codex_timeout)
         if isinstance(parsed_codex, dict):
@@ -844,13 +1336,42 @@ def prompt_review_action(message):
 
 def sanitize_filename_from_class_name(class_name):
     """Convert class name to a stable YAML filename."""
-    slug = re.sub(r"[^A-Za-z0-9]+", "_", class_name).strip("_")
+    slug = _NON_ALNUM_RE.sub("_", class_name).strip("_")
     return slug.lower() + ".yaml"
 
+def _rf_cutoff(floor):
+    """rapidfuzz score_cutoff (0..100) for a 0..1 floor, with float slack."""
+    return max(floor * 100 - 1e-6, 0.0)
+
+def similarity_ratio(a, b, floor=0.0):
+    """Return the difflib similarity ratio (0..1) of two strings.
+
+    Pairs that provably score below ``floor`` return 0.0 without the full
+    comparison. rapidfuzz's ratio (longest common subsequence) is never lower
+    than difflib's, whose matching blocks are a common subsequence, so it is
+    only used to rule pairs out; thresholds always see difflib scores.
+    """
+    if a == b:
+        return 1.0
+    if floor and rf_fuzz is not None and not rf_fuzz.ratio(a, b, score_cutoff=_rf_cutoff(floor)):
+        return 0.0
+    matcher = SequenceMatcher(None, a, b)
+    if floor and matcher.quick_ratio() < floor:
+        return 0.0
+    return matcher.ratio()
+
+def similarity_upper_bound(a, b):
+    """Return the largest ratio similarity_ratio(a, b) could reach, from lengths alone."""
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+# Class-name matching re-normalizes the same catalog names for every view.
+@functools.lru_cache(maxsize=8192, typed=True)
 def normalize_class_name(value):
     """Normalize class name for looser matching."""
-    return re.sub(r"[^a-z0-9]+", "", str(value).lower())
+    return _NON_ALNUM_LOWER_RE.sub("", str(value).lower())
 
+@functools.lru_cache(maxsize=8192, typed=True)
 def class_name_stem(value):
     """Remove common trailing dataset qualifiers to improve matching."""
     norm = normalize_class_name(value)
@@ -859,7 +1380,7 @@ def class_name_stem(value):
             return norm[: -len(suffix)]
     return norm
 
-def choose_grouped_assessment_file(modules_dir, yaml_files, class_name):
+def choose_grouped_assessment_file(modules_dir, yaml_files, class_name, class_index=None):
     """
     Choose default file for newly created assessment classes.
 
@@ -869,38 +1390,75 @@ def choose_grouped_assessment_file(modules_dir, yaml_files, class_name):
     """
     modules_abs = os.path.abspath(modules_dir)
     target_norm = class_name_stem(class_name)
-    best = None
-
-    for path, data in yaml_files.items():
-        if not data or "classes" not in data:
+    if class_index is None:
+        class_index = build_class_index(yaml_files)
+
+    # Per-file best score, in first-seen (yaml_files) order.
+    file_best = {}
+    is_assessment_file = {}
+    for path, _, _, existing_stem in _iter_indexed_classes(class_index):
+        if path not in is_assessment_file:
+            rel = os.path.relpath(path, modules_abs).replace("\\", "/")
+            is_assessment_file[path] = rel.startswith("clinical/assessments/")
+        if not is_assessment_file[path]:
             continue
-        rel = os.path.relpath(path, modules_abs).replace("\\", "/")
-        if not rel.startswith("clinical/assessments/"):
+        if similarity_upper_bound(target_norm, existing_stem) <= file_best.get(path, 0.0):
+            file_best.setdefault(path, 0.0)
             continue
+        score = similarity_ratio(target_norm, existing_stem, file_best.get(path, 0.0))
+        if score > file_best.get(path, 0.0):
+            file_best[path] = score
+        else:
+            file_best.setdefault(path, 0.0)
 
-        file_best = 0.0
-        for existing_name in data["classes"].keys():
-            score = SequenceMatcher(None, target_norm, class_name_stem(existing_name)).ratio()
-            if score > file_best:
-                file_best = score
-
-        if best is None or file_best > best[0]:
-            best = (file_best, path)
+    best = None
+    for path, score in file_best.items():
+        if best is None or score > best[0]:
+            best = (score, path)
 
     if best and best[0] >= 0.62:
         return best[1]
 
     return os.path.join(modules_dir, "clinical", "assessments", "other_generated_assessments.yaml")
 
-def persist_yaml_file(path, data, dry_run=False):
-    """Persist one YAML file immediately."""
+_ROUND_TRIP_DUMPER = None
+
+def _round_trip_dumper():
+    """Return the shared ruamel dumper, configured once per process."""
+    global _ROUND_TRIP_DUMPER
+    if _ROUND_TRIP_DUMPER is None:
+        _ROUND_TRIP_DUMPER = YAML()
+        _ROUND_TRIP_DUMPER.indent(mapping=2, sequence=4, offset=2)
+    return _ROUND_TRIP_DUMPER
+
+def persist_yaml_file(path, data, dry_run=False, fast_dump=False):
+    """Persist one YAML file immediately.
+
+    With ``fast_dump``, files built in this run (plain dicts, so no comments
+    to keep) are emitted with libyaml; ruamel-loaded files always round-trip.
+    """
     if dry_run:
         return
-    yaml = YAML()
-    yaml.indent(mapping=2, sequence=4, offset=2)
+    if fast_dump and pyyaml is not None and type(data) is dict:
+        try:
+            text = pyyaml.dump(
+                data, Dumper=_FastSafeDumper, sort_keys=False, indent=2,
+                default_flow_style=False, allow_unicode=True,
+            )
+        except pyyaml.YAMLError:
+            pass  # e.g. a ruamel scalar type copied in; fall back to ruamel
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            return
+    # Emit to memory first: one write per file, and a failed dump leaves the
+    # existing file untouched instead of truncated.
+    buf = io.BytesIO()
+    _round_trip_dumper().dump(data, buf)
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f)
+    with open(path, "wb") as f:
+        f.write(buf.getvalue())
 
 
 def run_assess_mode(
@@ -912,8 +1470,11 @@ def run_assess_mode(
     checkpoint_root,
     mode_checkpoint,
     args_signature,
+    class_index=None,
 ):
     signal.signal(signal.SIGINT, _signal_handler)
+    if class_index is None:
+        class_index = build_class_index(yaml_files)
     global stop_requested
     stop_requested = False
 
@@ -921,52 +1482,89 @@ def run_assess_mode(
     completed_keys = set(mode_checkpoint.get("completed_keys", []))
     completed_keys |= existing_keys
     processed_count = mode_checkpoint.get("processed_count", 0)
-    def persist_checkpoint_state():
-        mode_checkpoint["completed_keys"] = sorted(completed_keys)
-        mode_checkpoint["processed_count"] = processed_count
-        mode_checkpoint["args_signature"] = args_signature
-        checkpoint_root["modes"][args.mode] = mode_checkpoint
-        save_checkpoint(args.checkpoint_path, checkpoint_root)
+    new_keys = []
+    def mark_completed(item_key):
+        if item_key not in completed_keys:
+            completed_keys.add(item_key)
+            new_keys.append(item_key)
+    # Keys appended to the sidecar since the last full rewrite; batch flushes
+    # rarely land on a multiple of the resumed processed_count.
+    sidecar_key_count = 0
+    def persist_checkpoint_state(final=False):
+        nonlocal sidecar_key_count
+        sidecar_key_count += len(new_keys)
+        compact = sidecar_key_count >= CHECKPOINT_COMPACT_EVERY
+        if compact or final:
+            sidecar_key_count = 0
+        persist_mode_checkpoint(
+            args, checkpoint_root, mode_checkpoint, args_signature, completed_keys,
+            new_keys, processed_count, compact=compact, final=final,
+        )
 
     resume_file_exists = os.path.exists(args.proposal_path)
     writer, handle = open_proposal_writer(args.proposal_path, args.resume and resume_file_exists)
     enum_catalog = build_enum_catalog(yaml_files)
+    enum_index = build_enum_value_index(enum_catalog)
     existing_enum_names = {entry["name"] for entry in enum_catalog}
+    enum_base_counters = {}
+    attr_names_cache = {}
     rows_written = 0
     pause_counter = 0
+    # Per-row progress lines are written to stdout in FLUSH_BATCH chunks.
+    queued_messages = []
+    def flush_queued_messages():
+        if queued_messages:
+            sys.stdout.write("\n".join(queued_messages) + "\n")
+            sys.stdout.flush()
+            queued_messages.clear()
 
     try:
-        for view_name in sorted(all_dd_data.keys()):
+        # Unmapped views are dropped up front; several raw names may share a key.
+        mapped_views = [
+            (view_name, normalized_view, dd_fields)
+            for view_name, normalized_view, dd_fields in (
+                (view_name, normalize_view_name(view_name), dd_fields)
+                for view_name, dd_fields in sorted(all_dd_data.items(), key=lambda item: item[0])
+            )
+            if normalized_view in view_to_class
+        ]
+        for view_name, normalized_view, dd_fields in mapped_views:
             if stop_requested:
                 break
-            normalized_view = normalize_view_name(view_name)
-            if normalized_view not in view_to_class:
-                continue
             mapped_class = view_to_class[normalized_view]
             mapped_form_name = view_to_form_name.get(normalized_view, "")
             found_path, found_class_name, found_class_def = find_class_in_yaml(
-                yaml_files, mapped_class, loose=True
+                yaml_files, mapped_class, loose=True, class_index=class_index
             )
             class_exists = bool(found_path and found_class_name)
             target_class_name = found_class_name if class_exists else mapped_class
             if class_exists:
                 target_file = found_path
-                attributes = found_class_def.get("attributes", {}) if found_class_def else {}
+                # Assess mode never edits YAML, so each class's names can be shared.
+                attr_key = (target_file, target_class_name)
+                attr_names = attr_names_cache.get(attr_key)
+                if attr_names is None:
+                    attributes = found_class_def.get("attributes", {}) if found_class_def else {}
+                    attr_names = set(attributes.keys()) if isinstance(attributes, dict) else set()
+                    attr_names_cache[attr_key] = attr_names
             else:
                 target_file = choose_grouped_assessment_file(
-                    args.modules_dir, yaml_files, mapped_class
+                    args.modules_dir, yaml_files, mapped_class, class_index=class_index
                 )
-                attributes = {}
-
-            attr_names = set(attributes.keys()) if isinstance(attributes, dict) else set()
-            closest_candidate = (
-                None if class_exists else find_closest_class_candidate(yaml_files, mapped_class)
-            )
+                attr_names = set()
+            # Scored on first use only: resumed views often have no rows left to write.
+            closest_cache = []
+            def closest_candidate():
+                if not closest_cache:
+                    closest_cache.append(
+                        find_closest_class_candidate(yaml_files, mapped_class, class_index=class_index)
+                    )
+                return closest_cache[0]
 
-            for field in all_dd_data.get(view_name, []):
+            for field in dd_fields:
                 if stop_requested:
                     break
-                raw_field = field.get("field", "")
+                raw_field = field.field
                 attr_name = to_camel_case(raw_field)
                 if not attr_name:
                     continue
@@ -974,7 +1572,7 @@ def run_assess_mode(
                 if item_key in completed_keys:
                     continue
 
-                field_values = parse_values_column(field.get("values", ""))
+                field_values, value_set = parse_values_cached(field.values)
                 enum_action = "none"
                 enum_name = ""
                 attribute_range = "string"
@@ -982,31 +1580,32 @@ def run_assess_mode(
                 if is_boolean_values(field_values, args.boolean_rule):
                     attribute_range = "boolean"
                 elif field_values and args.enum_strategy != "keep-string":
-                    normalized_values = [v for v in field_values if v]
-                    value_set = frozenset(normalize_value_token(v) for v in normalized_values)
+                    normalized_values = list(field_values)
                     matching_enum = None
                     if args.enum_strategy == "reuse-first":
-                        matching_enum = find_matching_enum(normalized_values, enum_catalog)
+                        matching_enum = find_matching_enum(value_set, enum_index)
                     if matching_enum and args.enum_strategy == "reuse-first":
                         attribute_range = matching_enum["name"]
                         enum_action = "reuse"
                         enum_name = matching_enum["name"]
                     else:
                         enum_action = "create"
-                        enum_name = suggest_enum_name(target_class_name, attr_name, existing_enum_names)
-                        attribute_range = enum_name
-                        enum_catalog.append(
-                            {
-                                "name": enum_name,
-                                "file": target_file,
-                                "value_set": value_set,
-                                "raw_values": normalized_values,
-                            }
+                        enum_name = suggest_enum_name(
+                            target_class_name, attr_name, existing_enum_names, enum_base_counters
                         )
+                        attribute_range = enum_name
+                        new_entry = {
+                            "name": enum_name,
+                            "file": target_file,
+                            "value_set": value_set,
+                            "raw_values": normalized_values,
+                        }
+                        enum_catalog.append(new_entry)
+                        enum_index.setdefault(value_set, new_entry)
                 # status metadata
                 if class_exists:
                     if attr_name in attr_names:
-                        completed_keys.add(item_key)
+                        mark_completed(item_key)
                         continue
                     status = "new_attribute"
                     action = "add_attribute"
@@ -1016,10 +1615,11 @@ def run_assess_mode(
                 else:
                     status = "new_class"
                     action = "create_class"
-                    if closest_candidate:
+                    candidate = closest_candidate()
+                    if candidate:
                         reason = (
                             f"Mapped '{mapped_class}' missing; closest candidate "
-                            f"'{closest_candidate['class_name']}' ({closest_candidate['file']})."
+                            f"'{candidate['class_name']}' ({candidate['file']})."
                         )
                     else:
                         reason = f"Mapped class '{mapped_class}' missing in modules; will create."
@@ -1036,28 +1636,32 @@ def run_assess_mode(
                     "attribute_range": attribute_range,
                     "enum_action": enum_action,
                     "enum_name": enum_name,
-                    "enum_values": json.dumps(field_values),
-                    "values_raw": field.get("values", ""),
+                    "enum_values": dumps_compact(list(field_values)),
+                    "values_raw": field.values,
                     "reason": reason,
                     "status": status,
                     "approved": "false",
                 }
                 writer.writerow(row)
-                handle.flush()
                 rows_written += 1
                 pause_counter += 1
                 processed_count += 1
                 existing_keys.add(item_key)
-                completed_keys.add(item_key)
-
-                persist_checkpoint_state()
+                mark_completed(item_key)
 
-                print(
+                queued_messages.append(
                     f"    [Assess] queued {status} '{attr_name}' for class '{target_class_name}' "
                     f"({target_file})"
                 )
 
+                if rows_written % FLUSH_BATCH == 0:
+                    # Rows must reach the proposal before the checkpoint records them.
+                    handle.flush()
+                    persist_checkpoint_state()
+                    flush_queued_messages()
+
                 if args.pause_after and pause_counter >= args.pause_after:
+                    flush_queued_messages()
                     print(f"    [Assess] pause triggered after {pause_counter} rows.")
                     stop_requested = True
                     break
@@ -1065,95 +1669,136 @@ def run_assess_mode(
                 break
     finally:
         handle.close()
+        flush_queued_messages()
 
-    persist_checkpoint_state()
+    persist_checkpoint_state(final=True)
 
     if stop_requested:
         print(f"[Assess] Process paused. Run with --resume to continue from {args.proposal_path}.")
     else:
         print(f"[Assess] Proposal ready ({rows_written} new rows) at {args.proposal_path}.")
-def find_class_in_yaml(yaml_files, class_name, loose=True):
-    """Find class definition location with exact then optional loose matching."""
+def find_class_in_yaml(yaml_files, class_name, loose=True, class_index=None):
+    """Find class definition location with exact then optional loose matching.
+
+    Pass a ClassIndex (see build_class_index) to avoid rebuilding it per call.
+    """
+    if class_index is None:
+        class_index = build_class_index(yaml_files)
+
     # Exact match first
-    for path, data in yaml_files.items():
-        if data and "classes" in data and class_name in data["classes"]:
-            return path, class_name, data["classes"][class_name]
+    hit = _first_indexed_class(yaml_files, class_index, class_index.exact, class_name)
+    if hit:
+        return hit
 
     if not loose:
         return None, None, None
 
     # Case-insensitive exact key match
-    target_lower = str(class_name).lower()
-    for path, data in yaml_files.items():
-        if not data or "classes" not in data:
-            continue
-        for existing_name, class_def in data["classes"].items():
-            if str(existing_name).lower() == target_lower:
-                return path, existing_name, class_def
+    hit = _first_indexed_class(yaml_files, class_index, class_index.lower, str(class_name).lower())
+    if hit:
+        return hit
 
-    # Normalized/stem-based and fuzzy matching
+    # Normalized/stem-based match: the earliest class matching either wins.
     target_norm = normalize_class_name(class_name)
     target_stem = class_name_stem(class_name)
+    candidates = []
+    if target_norm in class_index.norm:
+        candidates.append(class_index.norm[target_norm][0])
+    if target_stem and target_stem in class_index.stem:
+        candidates.append(class_index.stem[target_stem][0])
+    if candidates:
+        path, existing_name, _, _ = class_index.flat[min(candidates)]
+        return path, existing_name, yaml_files[path]["classes"][existing_name]
+
+    # Fuzzy matching
+    entries = _iter_indexed_classes(class_index)
+    if rf_process is not None:
+        # One C pass keeps only names whose rapidfuzz score (an upper bound on
+        # difflib's) reaches the threshold; difflib still picks among them.
+        entries = [entry for entry in entries if entry[2]]
+        hits = rf_process.extract(
+            target_norm, [entry[2] for entry in entries], scorer=rf_fuzz.ratio, processor=None,
+            score_cutoff=_rf_cutoff(0.92), limit=None,
+        )
+        entries = [entries[index] for index in sorted(hit[2] for hit in hits)]
+
     best = None
-    for path, data in yaml_files.items():
-        if not data or "classes" not in data:
+    for path, existing_name, existing_norm, _ in entries:
+        if not existing_norm:
             continue
-        for existing_name, class_def in data["classes"].items():
-            existing_norm = normalize_class_name(existing_name)
-            existing_stem = class_name_stem(existing_name)
-            if not existing_norm:
-                continue
-            if target_norm == existing_norm or (target_stem and target_stem == existing_stem):
-                return path, existing_name, class_def
-
-            ratio = SequenceMatcher(None, target_norm, existing_norm).ratio()
-            if ratio >= 0.92:
-                if best is None or ratio > best[0]:
-                    best = (ratio, path, existing_name, class_def)
+        # Skip pairs whose lengths alone rule out beating the threshold/best.
+        bound = similarity_upper_bound(target_norm, existing_norm)
+        if bound < 0.92 or (best is not None and bound <= best[0]):
+            continue
+        ratio = similarity_ratio(target_norm, existing_norm, best[0] if best else 0.92)
+        if ratio >= 0.92:
+            if best is None or ratio > best[0]:
+                best = (ratio, path, existing_name)
 
     if best:
-        return best[1], best[2], best[3]
+        return best[1], best[2], yaml_files[best[1]]["classes"][best[2]]
     return None, None, None
 
-def find_closest_class_candidate(yaml_files, class_name):
+def find_closest_class_candidate(yaml_files, class_name, class_index=None):
     """Return the closest existing class candidate (if any) for AI context."""
     target_norm = normalize_class_name(class_name)
     if not target_norm:
         return None
+    if class_index is None:
+        class_index = build_class_index(yaml_files)
+    target_stem = class_name_stem(class_name)
 
     best = None
-    for path, data in yaml_files.items():
-        if not data or "classes" not in data:
+    for path, existing_name, existing_norm, existing_stem in _iter_indexed_classes(class_index):
+        if not existing_norm:
             continue
-        for existing_name, class_def in data["classes"].items():
-            existing_norm = normalize_class_name(existing_name)
-            if not existing_norm:
-                continue
-            ratio = SequenceMatcher(None, target_norm, existing_norm).ratio()
-            stem_ratio = SequenceMatcher(
-                None, class_name_stem(class_name), class_name_stem(existing_name)
-            ).ratio()
-            score = max(ratio, stem_ratio)
-            if best is None or score > best["score"]:
-                best = {
-                    "score": round(score, 4),
-                    "class_name": existing_name,
-                    "file": path,
-                    "attribute_count": len(class_def.get("attributes", {}))
-                    if isinstance(class_def, dict)
-                    else 0,
-                }
+        if best is None:
+            ratio = similarity_ratio(target_norm, existing_norm)
+            stem_ratio = similarity_ratio(target_stem, existing_stem)
+        else:
+            # Only score pairs whose lengths leave room to beat the current best.
+            ratio = stem_ratio = 0.0
+            if similarity_upper_bound(target_norm, existing_norm) > best["score"]:
+                ratio = similarity_ratio(target_norm, existing_norm, best["score"])
+            if similarity_upper_bound(target_stem, existing_stem) > best["score"]:
+                stem_ratio = similarity_ratio(target_stem, existing_stem, best["score"])
+        score = max(ratio, stem_ratio)
+        if best is None or score > best["score"]:
+            class_def = yaml_files[path]["classes"][existing_name]
+            best = {
+                "score": round(score, 4),
+                "class_name": existing_name,
+                "file": path,
+                "attribute_count": len(class_def.get("attributes", {}))
+                if isinstance(class_def, dict)
+                else 0,
+            }
     return best
 
-def build_class_catalog(yaml_files, modules_dir):
-    """Build lightweight catalog of classes for AI context."""
+# AI prompts only show this many classes from the catalog.
+CLASS_CATALOG_PREVIEW_SIZE = 60
+
+def build_class_catalog_preview(yaml_files, modules_dir):
+    """Render the catalog sample embedded in AI prompts (once per catalog change)."""
+    catalog = build_class_catalog(yaml_files, modules_dir, limit=CLASS_CATALOG_PREVIEW_SIZE)
+    return json.dumps(catalog, indent=2)
+
+def build_class_catalog(yaml_files, modules_dir, limit=None):
+    """Build lightweight catalog of classes for AI context.
+
+    ``limit`` stops after that many classes, which is all the prompt preview needs.
+    """
     catalog = []
     modules_dir_abs = os.path.abspath(modules_dir)
     for path, data in yaml_files.items():
         if not data or "classes" not in data:
             continue
+        if limit is not None and len(catalog) >= limit:
+            break
         rel_path = os.path.relpath(path, modules_dir_abs)
         for class_name, class_def in data["classes"].items():
+            if limit is not None and len(catalog) >= limit:
+                break
             attrs = class_def.get("attributes") if isinstance(class_def, dict) else {}
             attr_count = len(attrs) if isinstance(attrs, dict) else 0
             catalog.append(
@@ -1191,7 +1836,7 @@ def ai_review_class_placement(
     dd_fields,
     modules_dir,
     default_target_file,
-    class_catalog,
+    class_catalog_preview,
     timeout,
     closest_candidate=None,
     ai_provider="gemini",
@@ -1200,7 +1845,7 @@ def ai_review_class_placement(
     user_feedback=None,
 ):
     """Ask AI where to place/create class for this view."""
-    field_names = [f.get("field", "") for f in dd_fields[:20]]
+    field_names = [f.field for f in dd_fields[:20]]
     prompt = f"""You are helping place a clinical data model class in a LinkML repo.
 
 View name: {view_name}
@@ -1209,7 +1854,7 @@ Default target file: {os.path.relpath(default_target_file, os.path.abspath(modul
 Incoming fields (sample): {field_names}
 
 Existing classes (sample):
-{json.dumps(class_catalog[:60], indent=2)}
+{class_catalog_preview}
 
 Closest class-matching candidate (if available):
 {json.dumps(closest_candidate or {}, indent=2)}
@@ -1237,6 +1882,8 @@ Return ONLY JSON with this schema:
         timeout=timeout,
         use_codex_fallback=use_codex_fallback,
         codex_timeout=codex_timeout,
+        # A revision request should get a fresh answer, not a remembered one.
+        use_cache=not user_feedback,
     )
     if not isinstance(parsed, dict):
         if use_codex_fallback:
@@ -1278,7 +1925,7 @@ def ai_review_attribute_placement(
     attr_name,
     field,
     modules_dir,
-    class_catalog,
+    class_catalog_preview,
     timeout,
     ai_provider="gemini",
     use_codex_fallback=False,
@@ -1292,10 +1939,10 @@ View name: {view_name}
 Default class: {class_name}
 Default file: {os.path.relpath(target_file, os.path.abspath(modules_dir))}
 Attribute name: {attr_name}
-Field source info: {json.dumps(field, ensure_ascii=True)}
+Field source info: {json.dumps(field._asdict(), ensure_ascii=True)}
 
 Existing classes (sample):
-{json.dumps(class_catalog[:60], indent=2)}
+{class_catalog_preview}
 
 Return ONLY JSON with this schema:
 {{
@@ -1317,6 +1964,8 @@ Return ONLY JSON with this schema:
         timeout=timeout,
         use_codex_fallback=use_codex_fallback,
         codex_timeout=codex_timeout,
+        # A revision request should get a fresh answer, not a remembered one.
+        use_cache=not user_feedback,
     )
     if not isinstance(parsed, dict):
         if use_codex_fallback:
@@ -1327,7 +1976,7 @@ Return ONLY JSON with this schema:
             "target_file": target_file,
             "attribute_name": attr_name,
             "range": "string",
-            "title": field.get("description", ""),
+            "title": field.description,
             "reason": "ai_unavailable_or_invalid",
         }
     if source == "codex":
@@ -1338,7 +1987,7 @@ Return ONLY JSON with this schema:
     new_file = resolve_target_file(modules_dir, parsed.get("target_file"), target_file)
     new_attr = str(parsed.get("attribute_name", attr_name)).strip() or attr_name
     attr_range = str(parsed.get("range", "string")).strip() or "string"
-    attr_title = str(parsed.get("title", field.get("description", ""))).strip() or field.get("description", "")
+    attr_title = str(parsed.get("title", field.description)).strip() or field.description
     reason = str(parsed.get("reason", "")).strip()
     return {
         "action": action,
@@ -1353,6 +2002,8 @@ Return ONLY JSON with this schema:
 # --- Main Logic ---
 
 def main():
+    global AI_CACHE_DIR, READ_BUFFER_BYTES, stop_requested
+
     # --- Argument Parsing ---
     parser = argparse.ArgumentParser(description="Update data model from data dictionaries.")
     parser.add_argument("--modules-dir", required=True, help="Path to the modules directory.")
@@ -1393,6 +2044,11 @@ def main():
         default="gemini",
         help="Primary AI provider for review mode (default: gemini). Set to codex to disable Gemini calls.",
     )
+    parser.add_argument(
+        "--no-ai-cache",
+        action="store_true",
+        help="Always query the AI provider instead of reusing answers cached in ai_cache/ beside the checkpoint.",
+    )
     parser.add_argument(
         "--gemini-timeout",
         type=int,
@@ -1422,6 +2078,11 @@ def main():
              "By default, attribute suggestions are auto-accepted while class placement remains interactive.",
     )
     parser.add_argument("--dry-run", action="store_true", help="If set, the script will not write any files.")
+    parser.add_argument(
+        "--fast-yaml-dump",
+        action="store_true",
+        help="Write YAML files created by this run with libyaml (PyYAML) instead of ruamel.yaml.",
+    )
     parser.add_argument(
         "--mode",
         choices=["assess", "apply"],
@@ -1443,6 +2104,11 @@ def main():
         action="store_true",
         help="Resume processing from the last checkpoint.",
     )
+    parser.add_argument(
+        "--no-yaml-cache",
+        action="store_true",
+        help=f"Always re-parse module YAML instead of using {YAML_CACHE_FILENAME} beside the checkpoint.",
+    )
     parser.add_argument(
         "--reset-checkpoint",
         action="store_true",
@@ -1466,8 +2132,17 @@ def main():
         default="strict",
         help="Boolean normalization rule for DD values (default: strict true/false only).",
     )
+    parser.add_argument(
+        "--read-buffer-bytes",
+        type=int,
+        default=READ_BUFFER_BYTES,
+        help=f"Read buffer size for CSV inputs (default: {READ_BUFFER_BYTES}).",
+    )
     
     args = parser.parse_args()
+    if args.read_buffer_bytes <= 0:
+        parser.error("--read-buffer-bytes must be a positive integer.")
+    READ_BUFFER_BYTES = args.read_buffer_bytes
     if args.generate_view_to_class:
         if not args.assess_staging_folder or not args.prevent_staging_folder:
             parser.error(
@@ -1486,6 +2161,13 @@ def main():
         parser.error(
             "Provide data dictionaries via --dd-dir or both --assess-dd-synid and --prevent-dd-synid."
         )
+    cli_checks = []
+    if args.use_gemini_review and args.ai_provider == "gemini":
+        cli_checks.append(check_gemini_available)
+    if args.use_codex_fallback or args.use_gemini_review:
+        cli_checks.append(check_codex_available)
+    prewarm_cli_checks(cli_checks)
+
     if args.use_codex_fallback and not check_codex_available():
         parser.error(
             "--use-codex-fallback requested but codex CLI is not available."
@@ -1518,9 +2200,14 @@ def main():
         parser.error("--pause-after must be zero or positive.")
 
     checkpoint_path = os.path.abspath(args.checkpoint_path)
-    if args.reset_checkpoint and os.path.exists(checkpoint_path):
-        os.remove(checkpoint_path)
+    if args.reset_checkpoint:
+        for stale_path in (checkpoint_path, checkpoint_delta_path(checkpoint_path)):
+            if os.path.exists(stale_path):
+                os.remove(stale_path)
     checkpoint_root = load_checkpoint(checkpoint_path) or {}
+    if os.path.exists(checkpoint_delta_path(checkpoint_path)):
+        # Fold replayed deltas in now so new appends never follow a torn line.
+        save_checkpoint(checkpoint_path, checkpoint_root)
     modes_state = checkpoint_root.setdefault("modes", {})
     if args.reset_checkpoint:
         modes_state.pop(args.mode, None)
@@ -1530,6 +2217,7 @@ def main():
         parser.error("Checkpoint arguments differ; run with --reset-checkpoint to continue.")
 
     signal.signal(signal.SIGINT, _signal_handler)
+    signal.signal(signal.SIGTERM, _signal_handler)
 
     # --- Load Data ---
     print("Loading data...")
@@ -1544,8 +2232,7 @@ def main():
         if not view_to_class_path:
             view_to_class_path = generated_path
 
-    view_to_class = parse_view_to_class_mapping(view_to_class_path)
-    view_to_form_name = parse_view_to_form_name_mapping(view_to_class_path)
+    view_to_class, view_to_form_name = parse_view_mappings(view_to_class_path)
     
     dd_paths = resolve_data_dictionary_paths(args)
     all_dd_data = {}
@@ -1556,11 +2243,21 @@ def main():
             continue
         all_dd_data.update(parse_data_dictionary(dd_path))
 
-    yaml_files = load_yaml_files(args.modules_dir)
+    # Assess mode never writes YAML back, so it can skip the round-trip parser.
+    if not args.no_ai_cache:
+        AI_CACHE_DIR = os.path.join(os.path.dirname(checkpoint_path), "ai_cache")
+    yaml_cache_path = (
+        None
+        if args.no_yaml_cache
+        else os.path.join(os.path.dirname(checkpoint_path), YAML_CACHE_FILENAME)
+    )
+    yaml_files = load_yaml_files(
+        args.modules_dir, round_trip=args.mode != "assess", cache_path=yaml_cache_path
+    )
     
     # --- Process Data ---
     print("Processing data model updates...")
-    class_catalog = build_class_catalog(yaml_files, args.modules_dir)
+    class_index = build_class_index(yaml_files)
     if args.mode == "assess":
         run_assess_mode(
             args=args,
@@ -1571,10 +2268,61 @@ def main():
             checkpoint_root=checkpoint_root,
             mode_checkpoint=mode_checkpoint,
             args_signature=args_signature,
+            class_index=class_index,
         )
         return
+    # The class catalog only feeds AI prompts, which assess mode never sends.
+    class_catalog_preview = build_class_catalog_preview(yaml_files, args.modules_dir)
     enum_catalog = build_enum_catalog(yaml_files)
+    enum_index = build_enum_value_index(enum_catalog)
     existing_enum_names = {entry["name"] for entry in enum_catalog}
+    enum_base_counters = {}
+
+    completed_keys = set(mode_checkpoint.get("completed_keys", []))
+    processed_count = mode_checkpoint.get("processed_count", 0)
+    pause_counter = 0
+    new_keys = []
+    def mark_completed(item_key):
+        if item_key not in completed_keys:
+            completed_keys.add(item_key)
+            new_keys.append(item_key)
+    # Attribute names per class, keyed by id(class_def) so they survive renames;
+    # the class_def is kept alongside so a recycled id is never mistaken for it.
+    attr_name_sets = {}
+    def class_attr_names(class_def):
+        entry = attr_name_sets.get(id(class_def))
+        if entry is None or entry[0] is not class_def:
+            entry = (class_def, set(class_def["attributes"]))
+            attr_name_sets[id(class_def)] = entry
+        return entry[1]
+    # Files edited since the last checkpoint write; each is dumped once per flush
+    # rather than after every change.
+    dirty_files = set()
+    written_files = set()
+    def flush_dirty_files():
+        for path in dirty_files:
+            persist_yaml_file(path, yaml_files[path], args.dry_run, args.fast_yaml_dump)
+        written_files.update(dirty_files)
+        dirty_files.clear()
+    # Keys appended to the sidecar since the last full rewrite. processed_count
+    # resumes from the checkpoint, so it cannot say when to compact.
+    sidecar_key_count = 0
+    def persist_checkpoint_state(final=False):
+        nonlocal sidecar_key_count
+        # YAML edits must reach disk before the checkpoint marks their items done.
+        flush_dirty_files()
+        sidecar_key_count += len(new_keys)
+        compact = sidecar_key_count >= CHECKPOINT_COMPACT_EVERY
+        if compact or final:
+            sidecar_key_count = 0
+        persist_mode_checkpoint(
+            args, checkpoint_root, mode_checkpoint, args_signature, completed_keys,
+            new_keys, processed_count, compact=compact, final=final,
+        )
+    # Progress is only written every APPLY_FLUSH_EVERY items; if the loop dies
+    # with an exception, still save what was applied.
+    atexit.register(persist_checkpoint_state)
+
     for view_name, dd_fields in all_dd_data.items():
         if stop_requested:
             break
@@ -1586,7 +2334,9 @@ def main():
         mapped_class_name = view_to_class[normalized_view_name]
         mapped_form_name = view_to_form_name.get(normalized_view_name, "")
 
-        found_path, found_class_name, found_class_def = find_class_in_yaml(yaml_files, mapped_class_name, loose=False)
+        found_path, found_class_name, found_class_def = find_class_in_yaml(
+            yaml_files, mapped_class_name, loose=False, class_index=class_index
+        )
         default_class_name = mapped_class_name
         if found_path:
             default_target_file = found_path
@@ -1602,10 +2352,16 @@ def main():
                     f"(fallback file: {default_target_file})"
                 )
             else:
-                default_target_file = choose_grouped_assessment_file(args.modules_dir, yaml_files, mapped_class_name)
+                default_target_file = choose_grouped_assessment_file(
+                    args.modules_dir, yaml_files, mapped_class_name, class_index=class_index
+                )
                 print(f"  [Placement] Heuristic target for new class '{mapped_class_name}': {default_target_file}")
 
-        closest_candidate = find_closest_class_candidate(yaml_files, mapped_class_name) if not found_path else None
+        closest_candidate = (
+            find_closest_class_candidate(yaml_files, mapped_class_name, class_index=class_index)
+            if not found_path
+            else None
+        )
         if closest_candidate:
             print(
                 f"  [Class match] Closest candidate for '{mapped_class_name}': "
@@ -1626,7 +2382,7 @@ def main():
                 dd_fields=dd_fields,
                 modules_dir=args.modules_dir,
                 default_target_file=default_target_file,
-                class_catalog=class_catalog,
+                class_catalog_preview=class_catalog_preview,
                 timeout=args.gemini_timeout,
                 closest_candidate=closest_candidate,
                 ai_provider=args.ai_provider,
@@ -1684,7 +2440,7 @@ def main():
                         dd_fields=dd_fields,
                         modules_dir=args.modules_dir,
                         default_target_file=default_target_file,
-                        class_catalog=class_catalog,
+                        class_catalog_preview=class_catalog_preview,
                         timeout=args.gemini_timeout,
                         closest_candidate=closest_candidate,
                         ai_provider=args.ai_provider,
@@ -1708,6 +2464,7 @@ def main():
                 yaml_files=yaml_files,
                 old_class_name=rename_source_class_name,
                 new_class_name=class_name,
+                class_index=class_index,
             )
             if renamed:
                 print(
@@ -1720,9 +2477,8 @@ def main():
                     view_name=view_name,
                     form_name=mapped_form_name,
                 )
-                for touched_path in touched_paths:
-                    persist_yaml_file(touched_path, yaml_files[touched_path], args.dry_run)
-                class_catalog = build_class_catalog(yaml_files, args.modules_dir)
+                dirty_files.update(touched_paths)
+                class_catalog_preview = build_class_catalog_preview(yaml_files, args.modules_dir)
             else:
                 print(
                     f"  [Rename] Could not rename '{rename_source_class_name}' to '{class_name}': {rename_message}. "
@@ -1731,20 +2487,21 @@ def main():
 
         # Re-check whether class exists (class name may have changed after AI decision)
         found_path, found_class_name, found_class_def = find_class_in_yaml(
-            yaml_files, class_name, loose=(not force_create_new_class)
+            yaml_files, class_name, loose=(not force_create_new_class), class_index=class_index
         )
         if found_path:
             target_file = found_path
             class_name = found_class_name
             class_def = found_class_def
             if normalize_class_name(class_name) != normalize_class_name(mapped_class_name):
-                add_merge_note_to_class_description(
+                # Only rewrite the file when the merge note is new.
+                if add_merge_note_to_class_description(
                     class_def=class_def,
                     mapped_class_name=mapped_class_name,
                     view_name=view_name,
                     form_name=mapped_form_name,
-                )
-                persist_yaml_file(target_file, yaml_files[target_file], args.dry_run)
+                ):
+                    dirty_files.add(target_file)
         else:
             print(f"Creating new class '{class_name}' in file '{target_file}'")
             if target_file not in yaml_files or not yaml_files.get(target_file):
@@ -1757,29 +2514,31 @@ def main():
                 "attributes": {},
             }
             class_def = yaml_files[target_file]["classes"][class_name]
+            add_to_class_index(class_index, target_file, class_name)
             # Refresh class catalog for downstream AI context
-            class_catalog = build_class_catalog(yaml_files, args.modules_dir)
-            persist_yaml_file(target_file, yaml_files[target_file], args.dry_run)
+            class_catalog_preview = build_class_catalog_preview(yaml_files, args.modules_dir)
+            dirty_files.add(target_file)
 
         if "attributes" not in class_def or class_def["attributes"] is None:
             class_def["attributes"] = {}
+            dirty_files.add(target_file)
 
         for field in dd_fields:
             if stop_requested:
                 break
-            attr_name = to_camel_case(field['field'])
+            attr_name = to_camel_case(field.field)
             if not attr_name:
                 continue
 
             # Skip if already present in the current class.
-            if attr_name in class_def["attributes"]:
+            if attr_name in class_attr_names(class_def):
                 continue
 
             target_class_name = class_name
             target_file_for_attr = target_file
             target_attr_name = attr_name
             target_attr_range = "string"
-            target_attr_title = field.get("description", "")
+            target_attr_title = field.description
 
             if args.use_gemini_review:
                 attr_decision = ai_review_attribute_placement(
@@ -1789,13 +2548,13 @@ def main():
                     attr_name=attr_name,
                     field=field,
                     modules_dir=args.modules_dir,
-                    class_catalog=class_catalog,
+                    class_catalog_preview=class_catalog_preview,
                     timeout=args.gemini_timeout,
                     ai_provider=args.ai_provider,
                     use_codex_fallback=effective_use_codex_fallback,
                     codex_timeout=args.codex_timeout,
                 )
-                field_raw_name = field.get("field", "")
+                field_raw_name = field.field
                 force_attribute_confirmation = is_view_like_name(field_raw_name)
                 if force_attribute_confirmation:
                     print(
@@ -1818,7 +2577,7 @@ def main():
                         target_file_for_attr = attr_decision.get("target_file", target_file)
                         target_attr_name = attr_decision.get("attribute_name", attr_name)
                         target_attr_range = attr_decision.get("range", "string") or "string"
-                        target_attr_title = attr_decision.get("title", field.get("description", "")) or field.get("description", "")
+                        target_attr_title = attr_decision.get("title", field.description) or field.description
                 elif (not args.confirm_attribute_changes) and not force_attribute_confirmation:
                     print(
                         f"[AI:{args.ai_provider}][auto-accept-attr] Attribute suggestion: action={attr_decision['action']} "
@@ -1834,7 +2593,7 @@ def main():
                         target_file_for_attr = attr_decision.get("target_file", target_file)
                         target_attr_name = attr_decision.get("attribute_name", attr_name)
                         target_attr_range = attr_decision.get("range", "string") or "string"
-                        target_attr_title = attr_decision.get("title", field.get("description", "")) or field.get("description", "")
+                        target_attr_title = attr_decision.get("title", field.description) or field.description
                 else:
                     while True:
                         print(
@@ -1844,7 +2603,7 @@ def main():
                             f"reason={attr_decision.get('reason', '')}"
                         )
                         review_action = prompt_review_action(
-                            f"Review attribute decision for field '{field['field']}' in view '{view_name}'"
+                            f"Review attribute decision for field '{field.field}' in view '{view_name}'"
                         )
                         if review_action == "accept":
                             if attr_decision.get("action") == "skip":
@@ -1855,7 +2614,7 @@ def main():
                                 target_file_for_attr = attr_decision.get("target_file", target_file)
                                 target_attr_name = attr_decision.get("attribute_name", attr_name)
                                 target_attr_range = attr_decision.get("range", "string") or "string"
-                                target_attr_title = attr_decision.get("title", field.get("description", "")) or field.get("description", "")
+                                target_attr_title = attr_decision.get("title", field.description) or field.description
                             break
                         if review_action == "skip":
                             print(f"  Skipped attribute '{attr_name}' by user decision.")
@@ -1870,7 +2629,7 @@ def main():
                             attr_name=attr_name,
                             field=field,
                             modules_dir=args.modules_dir,
-                            class_catalog=class_catalog,
+                            class_catalog_preview=class_catalog_preview,
                             timeout=args.gemini_timeout,
                             ai_provider=args.ai_provider,
                             use_codex_fallback=effective_use_codex_fallback,
@@ -1887,7 +2646,7 @@ def main():
 
             # Ensure target class exists for attribute placement.
             target_path_existing, target_class_existing_name, target_class_def = find_class_in_yaml(
-                yaml_files, target_class_name, loose=True
+                yaml_files, target_class_name, loose=True, class_index=class_index
             )
             if target_path_existing:
                 target_file_for_attr = target_path_existing
@@ -1904,18 +2663,22 @@ def main():
                     "attributes": {},
                 }
                 target_class_def = yaml_files[target_file_for_attr]["classes"][target_class_name]
-                class_catalog = build_class_catalog(yaml_files, args.modules_dir)
-                persist_yaml_file(target_file_for_attr, yaml_files[target_file_for_attr], args.dry_run)
+                add_to_class_index(class_index, target_file_for_attr, target_class_name)
+                class_catalog_preview = build_class_catalog_preview(yaml_files, args.modules_dir)
+                dirty_files.add(target_file_for_attr)
 
             if "attributes" not in target_class_def or target_class_def["attributes"] is None:
                 target_class_def["attributes"] = {}
+                dirty_files.add(target_file_for_attr)
 
-            if target_attr_name in target_class_def["attributes"]:
+            target_attr_names = class_attr_names(target_class_def)
+            if target_attr_name in target_attr_names:
                 print(f"  Attribute '{target_attr_name}' already exists in class '{target_class_name}'. Skipping.")
-                completed_keys.add(item_key)
+                mark_completed(item_key)
                 processed_count += 1
                 pause_counter += 1
-                persist_checkpoint_state()
+                if processed_count % APPLY_FLUSH_EVERY == 0:
+                    persist_checkpoint_state()
                 continue
 
             target_attr_range, enum_action, enum_entry = determine_attribute_range(
@@ -1926,15 +2689,18 @@ def main():
                 target_file_for_attr,
                 yaml_files,
                 enum_catalog,
+                enum_index,
                 existing_enum_names,
+                enum_base_counters,
             )
             print(f"  Adding attribute '{target_attr_name}' to class '{target_class_name}'")
             target_class_def["attributes"][target_attr_name] = {
                 "title": target_attr_title,
-                "description": field.get("description", ""),
+                "description": field.description,
                 "range": target_attr_range,
             }
-            persist_yaml_file(target_file_for_attr, yaml_files[target_file_for_attr], args.dry_run)
+            target_attr_names.add(target_attr_name)
+            dirty_files.add(target_file_for_attr)
             if enum_action == "create" and enum_entry:
                 print(
                     f"    [Enum] Created '{enum_entry['name']}' in {enum_entry['file']} "
@@ -1944,10 +2710,11 @@ def main():
                 print(
                     f"    [Enum] Reusing '{enum_entry['name']}' from {enum_entry['file']}."
                 )
-            completed_keys.add(item_key)
+            mark_completed(item_key)
             processed_count += 1
             pause_counter += 1
-            persist_checkpoint_state()
+            if processed_count % APPLY_FLUSH_EVERY == 0:
+                persist_checkpoint_state()
             if args.pause_after and pause_counter >= args.pause_after:
                 print(f"  [Apply] pause triggered after {pause_counter} processed items.")
                 stop_requested = True
@@ -1956,21 +2723,13 @@ def main():
     if stop_requested:
         print(f"[Apply] Processing paused after {pause_counter} items. Run with --resume.")
 
-    persist_checkpoint_state()
-
     # --- Write Changes ---
+    # The final checkpoint write flushes the last edited files; files this run
+    # never touched are left exactly as they were on disk.
+    persist_checkpoint_state(final=True)
+    atexit.unregister(persist_checkpoint_state)
     if not args.dry_run:
-        print("Writing changes to YAML files...")
-        yaml = YAML()
-        yaml.indent(mapping=2, sequence=4, offset=2)
-        for path, data in yaml_files.items():
-            try:
-                # Create directory if it doesn't exist
-                os.makedirs(os.path.dirname(path), exist_ok=True)
-                with open(path, 'w') as f:
-                    yaml.dump(data, f)
-            except Exception as e:
-                print(f"Error writing to {path}: {e}", file=sys.stderr)
+        print(f"Wrote changes to {len(written_files)} YAML files.")
     else:
         print("Dry run complete. No files were written.")
 
@@ -28,20 +28,20 @@ Examples:
 
 from __future__ import annotations
 import argparse
+import csv
 import io
 import json
 import os
 import pathlib
 import sys
-import tempfile
-from typing import Any, Dict
+from typing import Any, BinaryIO, Dict
 
-import pandas as pd  # pip install pandas openpyxl
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 DEFAULT_BASE = os.getenv("SCHEMATIC_BASE_URL", "https://schematic.api.sagebionetworks.org/v1")
+DOWNLOAD_CHUNK_BYTES = 1 << 20  # large chunks keep per-chunk Python overhead low
 
 
 # ---------- HTTP helpers ----------
@@ -78,13 +78,40 @@ def fail_with_response(r: requests.Response) -> None:
 
 # ---------- File helpers ----------
 
-def _xlsx_bytes_to_csv(xlsx_bytes: bytes, csv_path: pathlib.Path, sheet: str | int | None = None) -> None:
-    """Convert in-memory .xlsx bytes to CSV on disk (first sheet by default)."""
-    with io.BytesIO(xlsx_bytes) as bio:
-        df = pd.read_excel(bio, sheet_name=sheet, engine="openpyxl")
-        if isinstance(df, dict):  # If multiple sheets, pick the first
-            df = next(iter(df.values()))
-        df.to_csv(csv_path, index=False)
+def _xlsx_to_csv(xlsx_file: BinaryIO, csv_path: pathlib.Path, sheet: str | int | None = None) -> None:
+    """Convert a seekable binary .xlsx stream to CSV on disk (first sheet by default).
+
+    Rows are streamed from a read-only workbook straight into the CSV writer,
+    so the sheet is never materialized as a DataFrame.
+    """
+    # Imported here so the Excel download and validate commands work without it.
+    import openpyxl  # pip install openpyxl
+
+    wb = openpyxl.load_workbook(xlsx_file, read_only=True, data_only=True)
+    try:
+        if sheet is None:
+            ws = wb.worksheets[0]
+        elif isinstance(sheet, int):
+            ws = wb.worksheets[sheet]
+        else:
+            ws = wb[sheet]
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            width = None
+            for row in ws.iter_rows(values_only=True):
+                if all(v is None for v in row):
+                    continue  # formatted-but-empty template rows
+                if width is None:
+                    # The header row fixes the width; read-only sheets can report
+                    # formatted but empty trailing columns.
+                    width = len(row)
+                    while width and row[width - 1] is None:
+                        width -= 1
+                cells = ["" if v is None else v for v in row[:width]]
+                cells.extend([""] * (width - len(cells)))
+                writer.writerow(cells)
+    finally:
+        wb.close()  # read-only workbooks keep the archive open until closed
 
 
 # ---------- Commands ----------
@@ -113,26 +140,28 @@ def cmd_generate_manifest(args: argparse.Namespace) -> None:
     if not r.ok:
         fail_with_response(r)
 
-    content = b"".join(r.iter_content(8192))
     outpath = pathlib.Path(args.out)
 
     if args.output_format == "csv":
-        # Write to a temp .xlsx, then convert, then delete
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-            tmp.write(content)
-            tmp_path = pathlib.Path(tmp.name)
-
+        # Convert the downloaded .xlsx bytes in memory; no temp file needed
         if outpath.suffix.lower() != ".csv":
             outpath = outpath.with_suffix(".csv")
 
-        _xlsx_bytes_to_csv(tmp_path.read_bytes(), outpath, sheet=None)
-        tmp_path.unlink(missing_ok=True)  # delete temp .xlsx
+        with io.BytesIO() as buf:
+            for chunk in r.iter_content(DOWNLOAD_CHUNK_BYTES):
+                buf.write(chunk)
+            buf.seek(0)  # hand openpyxl the buffer itself; getvalue() would copy it
+            _xlsx_to_csv(buf, outpath, sheet=None)
         print(f"Saved CSV: {outpath}")
     else:
         if outpath.suffix.lower() != ".xlsx":
             outpath = outpath.with_suffix(".xlsx")
-        with open(outpath, "wb") as f:
-            f.write(content)
+        # Stream straight to disk; a dropped connection leaves only the .part file
+        part_path = outpath.with_name(outpath.name + ".part")
+        with open(part_path, "wb") as f:
+            for chunk in r.iter_content(DOWNLOAD_CHUNK_BYTES):
+                f.write(chunk)
+        part_path.replace(outpath)
         print(f"Saved Excel: {outpath}")
 
 
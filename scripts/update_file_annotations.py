@@ -1,65 +1,116 @@
 
 import json
 import os
+import pickle
 import pandas as pd
 import yaml
 from pathlib import Path
 
+from merge_all_als_annotations import load_json
+
+try:
+    from yaml import CSafeLoader as SchemaLoader
+except ImportError:  # PyYAML built without libyaml; the pure-Python loader is the fallback
+    from yaml import SafeLoader as SchemaLoader
+
+# Parsed schemas, reused while no schema file is added, removed or modified
+SCHEMA_CACHE_PATH = '.cache/schemas.pkl'
+
+# Rows per chunk when scanning a data file's subject column
+SUBJECT_COUNT_CHUNK_ROWS = 200_000
+
 def get_unique_subject_count(file_path, subject_column):
-    """Counts the number of unique subjects in a CSV file."""
+    """Counts the number of unique subjects in a CSV file.
+
+    Only the subject column is parsed, in chunks, so large files are never
+    loaded whole.
+    """
     if not os.path.exists(file_path):
         return 0
     try:
-        df = pd.read_csv(file_path)
-        if subject_column in df.columns:
-            return df[subject_column].nunique()
-    except Exception:
+        seen = set()
+        for chunk in pd.read_csv(file_path, usecols=[subject_column], dtype=str,
+                                 chunksize=SUBJECT_COUNT_CHUNK_ROWS):
+            seen.update(chunk[subject_column].dropna().unique())
+    except Exception:  # includes a missing subject column
         return 0
-    return 0
+    return len(seen)
 
 def find_subject_column(file_path):
     """Finds the subject ID column in a CSV file."""
     if not os.path.exists(file_path):
         return None
     try:
-        df = pd.read_csv(file_path, nrows=0)
-        for col in df.columns:
-            if 'subj' in col.lower() or 'uid' in col.lower():
-                return col
+        columns = pd.read_csv(file_path, nrows=0).columns
     except Exception:
         return None
-    return 'SubjectUID' # Fallback
+    return next((col for col in columns if 'subj' in col.lower() or 'uid' in col.lower()),
+                'SubjectUID')  # Fallback
 
-def get_description_from_schema(schemas, assessment_type):
-    """Gets the description for an assessment type from the schemas."""
+def build_description_index(schemas):
+    """Maps assessment types to descriptions from the schemas.
+
+    Class descriptions take precedence over AssessmentTypeEnum values; within
+    each, the first schema to define a name wins.
+    """
+    descriptions = {}
     for schema_data in schemas.values():
         if 'classes' in schema_data:
             for class_name, class_def in schema_data['classes'].items():
-                if class_name == assessment_type:
-                    return class_def.get('description', '')
-    # Check in enums too
+                descriptions.setdefault(class_name, (class_def or {}).get('description', ''))
+    # Enum values only fill names no class defined
     for schema_data in schemas.values():
         if 'enums' in schema_data:
-            for enum_name, enum_def in schema_data['enums'].items():
-                if enum_name == "AssessmentTypeEnum":
-                    if assessment_type in enum_def.get('permissible_values', {}):
-                        return enum_def['permissible_values'][assessment_type].get('description', '')
-    return ''
+            enum_def = schema_data['enums'].get("AssessmentTypeEnum")
+            if enum_def:
+                for value, value_def in enum_def.get('permissible_values', {}).items():
+                    descriptions.setdefault(value, (value_def or {}).get('description', ''))
+    return descriptions
+
+def load_schemas(schema_dir, cache_path=SCHEMA_CACHE_PATH):
+    """Loads every YAML schema under schema_dir, keyed by file name.
+
+    The result is pickled to cache_path together with each file's path,
+    mtime and size, and reused on later runs while those all still match.
+    """
+    paths = list(Path(schema_dir).rglob('*.yaml'))
+    stamp = []
+    for p in paths:
+        st = p.stat()
+        stamp.append((str(p), st.st_mtime_ns, st.st_size))
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['stamp'] == stamp:
+            return cached['schemas']
+    except Exception:
+        pass  # missing, stale format or unreadable; rebuild below
+
+    schemas = {}
+    for p in paths:
+        with open(p, 'r') as f:
+            schemas[p.name] = yaml.load(f, Loader=SchemaLoader)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'stamp': stamp, 'schemas': schemas}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: could not write schema cache {cache_path}: {e}")
+    return schemas
 
 def main():
     annotations_file = 'annotations/all_als/assess_file_annotations.json'
     data_dir = 'data/ALL_ALS/v3-DEC/ASSESS/files'
     schema_dir = 'modules'
 
-    # Load annotations
-    with open(annotations_file, 'r') as f:
-        annotations = json.load(f)
+    # Load annotations (orjson when available, stdlib json for NaN literals)
+    annotations = load_json(Path(annotations_file))
 
     # Load all schemas
-    schemas = {}
-    for p in Path(schema_dir).rglob('*.yaml'):
-        with open(p, 'r') as f:
-            schemas[p.name] = yaml.safe_load(f)
+    schemas = load_schemas(schema_dir)
+    descriptions = build_description_index(schemas)
 
     # Process each annotation
     for syn_id, file_info in annotations.items():
@@ -75,7 +126,7 @@ def main():
 
             # Fill description if empty and assessmentType exists
             if not ann.get('description') and ann.get('assessmentType') and ann.get('assessmentType')[0]:
-                ann['description'] = get_description_from_schema(schemas, ann['assessmentType'][0])
+                ann['description'] = descriptions.get(ann['assessmentType'][0], '')
             
             # Fill keywords if empty
             if not ann.get('keywords') or ann['keywords'] == ['']:
@@ -135,9 +186,14 @@ def main():
                         ann['individualCount'] = count
 
     
-    # Write updated annotations
+    # Write updated annotations, unless nothing was filled in. Writes stay on
+    # stdlib json so the tracked file's formatting does not churn.
+    updated = json.dumps(annotations, indent=2)
+    if Path(annotations_file).read_text() == updated:
+        print("Annotations already up to date.")
+        return
     with open(annotations_file, 'w') as f:
-        json.dump(annotations, f, indent=2)
+        f.write(updated)
 
     print("Annotations updated successfully.")
 
@@ -37,17 +37,30 @@ from synapseclient.api import delete_entity
 import asyncio
 
 
+# max in-flight delete requests, to stay polite to the Synapse REST API
+DELETE_CONCURRENCY = 32
+
 def delete_file_versions(synid_list:list, version_range:tuple, exceptions:list):
-    for synid in synid_list:
-        for version in range(version_range):
-            try:
-                if version != exceptions:
-                    async def delete_file_version():
-                         await delete_entity(entity_id=synid, version_number=version)
+    # one event loop for all deletes instead of asyncio.run per version
+    async def delete_all():
+        semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+        async def delete_file_version(synid, version):
+            async with semaphore:
+                try:
                     #print(f"Deleting version {version} of {synid}")
-                    asyncio.run(delete_file_version())
-            except Exception as e:
-                print(f"Could not delete version {version} of {synid}: {e}")
+                    await delete_entity(entity_id=synid, version_number=version)
+                except Exception as e:
+                    print(f"Could not delete version {version} of {synid}: {e}")
+
+        await asyncio.gather(*(
+            delete_file_version(synid, version)
+            for synid in synid_list
+            for version in range(version_range)
+            if version != exceptions
+        ))
+
+    asyncio.run(delete_all())
 
 
 def validate_annoations(): 
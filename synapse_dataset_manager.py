@@ -412,6 +412,21 @@ def get_required_fields(schema):
     return schema.get('required', [])
 
 
+# Validators keyed by id(schema); the schema object is kept alongside so a
+# recycled id from a garbage-collected schema never returns a stale validator.
+_SCHEMA_VALIDATOR_CACHE: Dict[int, Tuple[dict, Draft7Validator]] = {}
+
+
+def get_schema_validator(schema):
+    """Return a reusable Draft7Validator for a loaded JSON schema."""
+    cached = _SCHEMA_VALIDATOR_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    validator = Draft7Validator(schema)
+    _SCHEMA_VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
 def get_field_info(schema):
     """
     Extract field information from JSON schema for template generation.
@@ -615,8 +630,8 @@ def validate_annotation_against_schema(annotation, file_type, all_schemas):
 
     # Use jsonschema library for proper validation
     try:
-        # Create validator
-        validator = Draft7Validator(schema)
+        # Reuse the validator built for this schema
+        validator = get_schema_validator(schema)
 
         # Collect all validation errors
         validation_errors = list(validator.iter_errors(validation_annot))
@@ -5394,8 +5409,9 @@ def handle_generate_file_templates(args, config):
         files_dict = enumerate_files_with_folders(
             syn, args.folder, recursive=True, verbose=config.VERBOSE
         )
+        # Machine-read cache only, so skip pretty-printing.
         with open(cache_path, 'w') as f:
-            json.dump(files_dict, f, indent=2)
+            json.dump(files_dict, f, separators=(',', ':'))
         if config.VERBOSE:
             print(f"  Walkthrough cached to: {cache_path}")
 
@@ -8203,7 +8219,7 @@ def handle_sync_dataset_schema_annotations(args, config):
         normalized_current = _schema_sync_normalize_for_schema(current, schema)
         validation_errors = []
         if schema:
-            validator = Draft7Validator(schema)
+            validator = get_schema_validator(schema)
             for err in validator.iter_errors(normalized_current):
                 field = '.'.join(str(p) for p in err.path) if err.path else 'root'
                 validation_errors.append(f"{field}: {err.message}")
@@ -8318,7 +8334,7 @@ def handle_sync_dataset_schema_annotations(args, config):
                     normalized_current = _schema_sync_normalize_for_schema(current, schema)
                     validation_errors = []
                     if schema:
-                        validator = Draft7Validator(schema)
+                        validator = get_schema_validator(schema)
                         for err in validator.iter_errors(normalized_current):
                             field = '.'.join(str(p) for p in err.path) if err.path else 'root'
                             validation_errors.append(f"{field}: {err.message}")